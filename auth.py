@@ -2,6 +2,10 @@ import streamlit as st
 
 def authenticate_user():
     """Authenticate the user using a password from Streamlit secrets."""
+    # Once the session is authenticated there is nothing to check on later reruns
+    if st.session_state.get("authenticated", False):
+        return
+
     PASSWORD = st.secrets["password"]
     if "authenticated" not in st.session_state:
         st.session_state["authenticated"] = False
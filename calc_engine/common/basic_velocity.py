@@ -0,0 +1,62 @@
+# calc_engine/common/basic_velocity.py
+
+import math
+from functools import lru_cache
+
+# ln(-ln(0.98)) for the 50-year reference in the c_prob denominator (≈ -3.9019)
+LOG_NEG_LOG_098 = math.log(-math.log(0.98))
+
+@lru_cache(maxsize=256)
+def calculate_c_prob(K, n, return_period):
+    """
+    Calculate the probability factor c_prob for a return period other than 50 years
+    (BS EN 1991-1-4 Equation 4.2).
+
+        c_prob = ((1 - K · ln(-ln(1 - p))) / (1 - K · ln(-ln(0.98))))^n,  p = 1 / return period
+
+    Memoized, since the same (K, n, return period) is evaluated on every rerun.
+
+    Parameters:
+    -----------
+    K : float
+        Shape parameter (typically 0.2)
+    n : float
+        Exponent (typically 0.5)
+    return_period : int
+        Return period in years
+
+    Returns:
+    --------
+    c_prob : float
+        The probability factor
+    """
+    p = 1.0 / return_period
+    # log1p(-p) is ln(1 - p) without the rounding error of forming 1 - p for small p
+    numerator = 1.0 - K * math.log(-math.log1p(-p))
+    # K >= 0 keeps the denominator >= 1, so no zero guard is needed
+    denominator = 1.0 - K * LOG_NEG_LOG_098
+    return (numerator / denominator) ** n
+
+@lru_cache(maxsize=256)
+def calculate_c_alt(altitude, z):
+    """
+    Calculate the UK altitude factor c_alt (UK National Annex Equations NA.2a and NA.2b).
+
+        z ≤ 10 m:  c_alt = 1 + 0.001 · A
+        z > 10 m:  c_alt = 1 + 0.001 · A · (10 / z)^0.2
+
+    Parameters:
+    -----------
+    altitude : float
+        Site altitude above sea level A (in m)
+    z : float
+        Reference height (in m)
+
+    Returns:
+    --------
+    c_alt : float
+        The altitude factor
+    """
+    if z <= 10:
+        return 1 + 0.001 * altitude
+    return 1 + 0.001 * altitude * (10 / z) ** 0.2
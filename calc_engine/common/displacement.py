@@ -27,8 +27,7 @@ def calculate_displacement_height(st):
         )
 
     # Save inputs for reuse elsewhere
-    st.session_state.inputs["x"] = float(x)
-    st.session_state.inputs["h_ave"] = float(h_ave)
+    st.session_state.inputs.update(x=float(x), h_ave=float(h_ave))
 
     # Reference height
     z = float(st.session_state.inputs.get("z", 30.0))
@@ -50,13 +49,15 @@ def display_displacement_results(st, h_dis):
     Args:
         st: Streamlit object
         h_dis: Calculated displacement height
+        
+    Returns:
+        float: The effective height z - h_dis
     """
     # Get height z from session state
     z = st.session_state.inputs.get("z", 30.0)
     z_minus_h_dis = z - h_dis
     
-    # Store the calculated value in session state
-    st.session_state.inputs["z_minus_h_dis"] = z_minus_h_dis
-    
     st.write(f"Displacement height $h_{{dis}}$: {h_dis:.2f} m")
     st.write(f"Effective height ($z - h_{{dis}}$): {z_minus_h_dis:.2f} m")
+    
+    return z_minus_h_dis
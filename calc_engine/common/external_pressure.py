@@ -11,6 +11,53 @@ TT_DarkBlue = "rgb(0,48,60)"
 TT_Grey = "rgb(99,102,105)"
 TT_LightGrey = "rgb(229,229,229)"  # Lighter grey for the donut building
 
+# h/d points at which the vertical wall cp,e values are tabulated
+CPE_H_D_POINTS = [0.25, 1.0, 5.0]
+
+# UK cp,e values per zone at each h/d point (single Cpe values)
+UK_CPE_VALUES = {
+    "A": [-1.2, -1.2, -1.2],
+    "B": [-0.8, -0.8, -0.8],
+    "C": [-0.5, -0.5, -0.5],
+    "D": [0.7, 0.8, 0.8],
+}
+
+# EU Cpe,10 values per zone (for areas >= 10m²)
+EU_CPE_10_VALUES = {
+    "A": [-1.2, -1.2, -1.2],
+    "B": [-0.8, -0.8, -0.8],
+    "C": [-0.5, -0.5, -0.5],
+    "D": [0.7, 0.8, 0.8],
+}
+
+# EU Cpe,1 values per zone (for areas <= 1m²)
+EU_CPE_1_VALUES = {
+    "A": [-1.4, -1.4, -1.4],
+    "B": [-1.1, -1.1, -1.1],
+    "C": [-0.5, -0.5, -0.5],  # Same as Cpe,10 for zone C
+    "D": [1.0, 1.0, 1.0],
+}
+
+# Maximum funnelling cp,e for the side-suction zones: fixed values for the UK,
+# and ratios applied to the base Cpe values for the EU
+UK_FUNNELLING_MAX_CPE = {"A": -1.6, "B": -0.9, "C": -0.9}
+EU_FUNNELLING_RATIOS = {"A": 1.6 / 1.2, "B": 0.9 / 0.8, "C": 0.9 / 0.5}
+
+# Funnelling status shown per elevation, indexed by where the gap falls relative to e
+FUNNELLING_STATUS = (
+    "No Funnelling since **gap ≤ e/4**",
+    "Funnelling Applied since **e/4 < gap < e**",
+    "No Funnelling since **gap ≥ e**",
+)
+
+# Zone descriptions for the cp,e tables
+ZONE_DESCRIPTIONS = {
+    "A": "Side Suction (Edge)",
+    "B": "Side Suction",
+    "C": "Side Suction (Center)",
+    "D": "Windward Face",
+}
+
 def display_funnelling_inputs():
     """Display inputs for funnelling effect calculations"""
     
@@ -26,10 +73,12 @@ def display_funnelling_inputs():
         west_gap = st.number_input("West Gap [m]", min_value=0.0, value=st.session_state.inputs.get("west_gap", 10.0), help="Distance to nearest building from West face")
     
     # Save values to session state
-    st.session_state.inputs["north_gap"] = north_gap
-    st.session_state.inputs["south_gap"] = south_gap
-    st.session_state.inputs["east_gap"] = east_gap
-    st.session_state.inputs["west_gap"] = west_gap
+    st.session_state.inputs.update(
+        north_gap=float(north_gap),
+        south_gap=float(south_gap),
+        east_gap=float(east_gap),
+        west_gap=float(west_gap),
+    )
     
     # Create building layout visualization
     display_building_layout(north_gap, south_gap, east_gap, west_gap)
@@ -258,28 +307,67 @@ def calculate_cpe(consider_funnelling=True):
     For UK: Uses single Cpe values
     For EU: Interpolates between Cpe,10 and Cpe,1 based on loaded area
     
+    The inputs are read from session state and the calculation is memoized on
+    them, so reruns triggered by unrelated widgets reuse the previous result.
+    
     Parameters:
     - consider_funnelling: Boolean to enable/disable funnelling effects
     
     Returns:
     - Dictionary of DataFrames of cp,e values for different elevations
     """
-    import numpy as np
-    
-    h = st.session_state.inputs.get("z", 10.0)  # Building height
-    NS_dimension = st.session_state.inputs.get("NS_dimension", 20.0)
-    EW_dimension = st.session_state.inputs.get("EW_dimension", 40.0)
-    region = st.session_state.inputs.get("region", "United Kingdom")
+    inputs = st.session_state.inputs
+    region = inputs.get("region", "United Kingdom")
     
     # Get loaded area for EU calculations
-    loaded_area = st.session_state.inputs.get("loaded_area", 10.0) if region != "United Kingdom" else 10.0
+    loaded_area = inputs.get("loaded_area", 10.0) if region != "United Kingdom" else 10.0
+    
+    # Gap to the neighbouring building on each elevation, for funnelling
+    gaps = {
+        "North": inputs.get("north_gap", 10.0),
+        "South": inputs.get("south_gap", 10.0),
+        "East": inputs.get("east_gap", 10.0),
+        "West": inputs.get("west_gap", 10.0),
+    }
+    
+    return _calculate_cpe(
+        h=inputs.get("z", 10.0),  # Building height
+        NS_dimension=inputs.get("NS_dimension", 20.0),
+        EW_dimension=inputs.get("EW_dimension", 40.0),
+        region=region,
+        loaded_area=loaded_area,
+        gaps=gaps,
+        consider_funnelling=consider_funnelling,
+    )
+
+def _interpolate_cpe(zone_values, h_d_ratio):
+    """Linearly interpolate each zone's cp,e on h/d, clamped to the end values."""
+    return {
+        zone: float(np.interp(h_d_ratio, CPE_H_D_POINTS, values))
+        for zone, values in zone_values.items()
+    }
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def _calculate_cpe(h, NS_dimension, EW_dimension, region, loaded_area, gaps, consider_funnelling):
+    """
+    Compute the cp,e tables for calculate_cpe from explicit inputs.
+    
+    Parameters:
+    - h: Building height
+    - NS_dimension: North-South building dimension
+    - EW_dimension: East-West building dimension
+    - region: "United Kingdom" or another region (EU values)
+    - loaded_area: Loaded area in m² (EU Cpe,1 / Cpe,10 interpolation)
+    - gaps: Dictionary of gap to the neighbouring building per elevation
+    - consider_funnelling: Boolean to enable/disable funnelling effects
     
-    # Create results dictionary for each elevation
-    elevations = ["North", "South", "East", "West"]
-    results_by_elevation = {elevation: [] for elevation in elevations}
+    Returns:
+    - Dictionary of DataFrames of cp,e values for different elevations
+    """
+    results_by_elevation = {}
     
     # For each elevation, calculate cp,e values based on wind hitting that elevation
-    for elevation in elevations:
+    for elevation in ["North", "South", "East", "West"]:
         # Define dimensions based on elevation orientation
         if elevation in ["North", "South"]:
             b = EW_dimension  # Width of the elevation perpendicular to wind
@@ -291,214 +379,69 @@ def calculate_cpe(consider_funnelling=True):
         # Calculate h/d ratio
         h_d_ratio = h / d
         
-        # Define coefficient values based on region
-        if region == "United Kingdom":
-            # UK values - single Cpe values (original logic)
-            h_d_points = [0.25, 1.0, 5.0]
-            zone_A_values = [-1.2, -1.2, -1.2]
-            zone_B_values = [-0.8, -0.8, -0.8]
-            zone_C_values = [-0.5, -0.5, -0.5]
-            zone_D_values = [0.7, 0.8, 0.8]
-        else:
-            # EU values - separate Cpe,10 and Cpe,1 values from your table
-            h_d_points = [0.25, 1.0, 5.0]
-            
-            # Cpe,10 values (for areas >= 10m²)
-            zone_A_cpe10 = [-1.2, -1.2, -1.2]
-            zone_B_cpe10 = [-0.8, -0.8, -0.8]
-            zone_C_cpe10 = [-0.5, -0.5, -0.5]
-            zone_D_cpe10 = [0.7, 0.8, 0.8]
-            
-            # Cpe,1 values (for areas <= 1m²)
-            zone_A_cpe1 = [-1.4, -1.4, -1.4]
-            zone_B_cpe1 = [-1.1, -1.1, -1.1]
-            zone_C_cpe1 = [-0.5, -0.5, -0.5]  # Same as Cpe,10 for zone C
-            zone_D_cpe1 = [1.0, 1.0, 1.0]
-        
-        # Calculate base coefficients based on h/d ratio
+        # Interpolate each zone's coefficient on h/d (held constant outside 0.25 - 5)
         if region == "United Kingdom":
-            # UK calculation (original logic)
-            if h_d_ratio <= 0.25:
-                cp_A = zone_A_values[0]
-                cp_B = zone_B_values[0]
-                cp_C = zone_C_values[0]
-                cp_D = zone_D_values[0]
-            elif h_d_ratio >= 5.0:
-                cp_A = zone_A_values[2]
-                cp_B = zone_B_values[2]
-                cp_C = zone_C_values[2]
-                cp_D = zone_D_values[2]
-            else:
-                # Interpolate between known points
-                for i in range(len(h_d_points)-1):
-                    if h_d_points[i] <= h_d_ratio <= h_d_points[i+1]:
-                        factor = (h_d_ratio - h_d_points[i]) / (h_d_points[i+1] - h_d_points[i])
-                        cp_A = zone_A_values[i] + factor * (zone_A_values[i+1] - zone_A_values[i])
-                        cp_B = zone_B_values[i] + factor * (zone_B_values[i+1] - zone_B_values[i])
-                        cp_C = zone_C_values[i] + factor * (zone_C_values[i+1] - zone_C_values[i])
-                        cp_D = zone_D_values[i] + factor * (zone_D_values[i+1] - zone_D_values[i])
-                        break
+            # UK values - single Cpe values
+            cp = _interpolate_cpe(UK_CPE_VALUES, h_d_ratio)
         else:
-            # EU calculation - interpolate based on h/d ratio first, then on loaded area
-            
-            # First interpolate Cpe,10 values based on h/d ratio
-            if h_d_ratio <= 0.25:
-                cp_A_10 = zone_A_cpe10[0]
-                cp_B_10 = zone_B_cpe10[0]
-                cp_C_10 = zone_C_cpe10[0]
-                cp_D_10 = zone_D_cpe10[0]
-            elif h_d_ratio >= 5.0:
-                cp_A_10 = zone_A_cpe10[2]
-                cp_B_10 = zone_B_cpe10[2]
-                cp_C_10 = zone_C_cpe10[2]
-                cp_D_10 = zone_D_cpe10[2]
-            else:
-                # Interpolate between known points for Cpe,10
-                for i in range(len(h_d_points)-1):
-                    if h_d_points[i] <= h_d_ratio <= h_d_points[i+1]:
-                        factor = (h_d_ratio - h_d_points[i]) / (h_d_points[i+1] - h_d_points[i])
-                        cp_A_10 = zone_A_cpe10[i] + factor * (zone_A_cpe10[i+1] - zone_A_cpe10[i])
-                        cp_B_10 = zone_B_cpe10[i] + factor * (zone_B_cpe10[i+1] - zone_B_cpe10[i])
-                        cp_C_10 = zone_C_cpe10[i] + factor * (zone_C_cpe10[i+1] - zone_C_cpe10[i])
-                        cp_D_10 = zone_D_cpe10[i] + factor * (zone_D_cpe10[i+1] - zone_D_cpe10[i])
-                        break
+            # EU values - interpolate Cpe,10 and Cpe,1 on h/d, then on loaded area
+            cp_10 = _interpolate_cpe(EU_CPE_10_VALUES, h_d_ratio)
+            cp_1 = _interpolate_cpe(EU_CPE_1_VALUES, h_d_ratio)
             
-            # Then interpolate Cpe,1 values based on h/d ratio
-            if h_d_ratio <= 0.25:
-                cp_A_1 = zone_A_cpe1[0]
-                cp_B_1 = zone_B_cpe1[0]
-                cp_C_1 = zone_C_cpe1[0]
-                cp_D_1 = zone_D_cpe1[0]
-            elif h_d_ratio >= 5.0:
-                cp_A_1 = zone_A_cpe1[2]
-                cp_B_1 = zone_B_cpe1[2]
-                cp_C_1 = zone_C_cpe1[2]
-                cp_D_1 = zone_D_cpe1[2]
-            else:
-                # Interpolate between known points for Cpe,1
-                for i in range(len(h_d_points)-1):
-                    if h_d_points[i] <= h_d_ratio <= h_d_points[i+1]:
-                        factor = (h_d_ratio - h_d_points[i]) / (h_d_points[i+1] - h_d_points[i])
-                        cp_A_1 = zone_A_cpe1[i] + factor * (zone_A_cpe1[i+1] - zone_A_cpe1[i])
-                        cp_B_1 = zone_B_cpe1[i] + factor * (zone_B_cpe1[i+1] - zone_B_cpe1[i])
-                        cp_C_1 = zone_C_cpe1[i] + factor * (zone_C_cpe1[i+1] - zone_C_cpe1[i])
-                        cp_D_1 = zone_D_cpe1[i] + factor * (zone_D_cpe1[i+1] - zone_D_cpe1[i])
-                        break
-            
-            # Now interpolate between Cpe,1 and Cpe,10 based on loaded area using log₁₀
             if loaded_area <= 1.0:
                 # Use Cpe,1 values
-                cp_A = cp_A_1
-                cp_B = cp_B_1
-                cp_C = cp_C_1
-                cp_D = cp_D_1
+                cp = cp_1
             elif loaded_area >= 10.0:
                 # Use Cpe,10 values
-                cp_A = cp_A_10
-                cp_B = cp_B_10
-                cp_C = cp_C_10
-                cp_D = cp_D_10
+                cp = cp_10
             else:
                 # Logarithmic interpolation: Cpe = Cpe,1 - (Cpe,1 - Cpe,10) × log₁₀(A)
                 log_factor = np.log10(loaded_area)
-                
-                cp_A = cp_A_1 - (cp_A_1 - cp_A_10) * log_factor
-                cp_B = cp_B_1 - (cp_B_1 - cp_B_10) * log_factor
-                cp_C = cp_C_1 - (cp_C_1 - cp_C_10) * log_factor
-                cp_D = cp_D_1 - (cp_D_1 - cp_D_10) * log_factor
-        
-        # Store original values before funnelling adjustment
-        base_cp_A = cp_A
-        base_cp_B = cp_B
-        base_cp_C = cp_C
+                cp = {zone: cp_1[zone] - (cp_1[zone] - cp_10[zone]) * log_factor for zone in cp_1}
         
         # Check for funnelling effect based on elevation
-        if elevation == "North":
-            gap = st.session_state.inputs.get("north_gap", 10.0)
-        elif elevation == "South":
-            gap = st.session_state.inputs.get("south_gap", 10.0)
-        elif elevation == "East":
-            gap = st.session_state.inputs.get("east_gap", 10.0)
-        else:  # "West"
-            gap = st.session_state.inputs.get("west_gap", 10.0)
+        gap = gaps[elevation]
         
         # Calculate e (the smaller of b or 2h)
         e = min(b, 2*h)
         
-        # Initialize funnelling variables
-        has_funnelling = False
-        funnelling_increase_pct_A = 0
-        funnelling_increase_pct_B = 0
-        funnelling_increase_pct_C = 0
+        # Funnelling increase (%) per side-suction zone
+        funnelling_increase_pct = {}
         
         # Apply funnelling only if enabled and conditions are met
         if consider_funnelling and e/4 < gap < e:
-            has_funnelling = True
-            
-            # Define the funnelling approach based on region
-            if region == "United Kingdom":
-                # UK: Use fixed maximum values
-                max_funnel_cp_A = -1.6
-                max_funnel_cp_B = -0.9
-                max_funnel_cp_C = -0.9
-            else:
-                # EU: Apply ratios to the base Cpe values
-                max_funnel_cp_A = base_cp_A * (1.6 / 1.2)
-                max_funnel_cp_B = base_cp_B * (0.9 / 0.8)
-                max_funnel_cp_C = base_cp_C * (0.9 / 0.5)
-            
             if gap <= e/2:
                 # Interpolate between e/4 and e/2 (increasing effect)
                 factor = (gap - e/4) / (e/4)  # 0 at e/4, 1 at e/2
-                
-                # Calculate with funnelling
-                cp_A_with_funnel = base_cp_A + factor * (max_funnel_cp_A - base_cp_A)
-                cp_B_with_funnel = base_cp_B + factor * (max_funnel_cp_B - base_cp_B)
-                cp_C_with_funnel = base_cp_C + factor * (max_funnel_cp_C - base_cp_C)
-                
-                # Calculate percentage increase
-                funnelling_increase_pct_A = (abs(cp_A_with_funnel) - abs(base_cp_A)) / abs(base_cp_A) * 100
-                funnelling_increase_pct_B = (abs(cp_B_with_funnel) - abs(base_cp_B)) / abs(base_cp_B) * 100
-                funnelling_increase_pct_C = (abs(cp_C_with_funnel) - abs(base_cp_C)) / abs(base_cp_C) * 100
-                
-                # Update values with funnelling
-                cp_A = cp_A_with_funnel
-                cp_B = cp_B_with_funnel
-                cp_C = cp_C_with_funnel
-                
             else:
                 # Interpolate between e/2 and e (decreasing effect)
                 factor = (e - gap) / (e/2)  # 1 at e/2, 0 at e
+            
+            for zone, uk_max_cp in UK_FUNNELLING_MAX_CPE.items():
+                base_cp = cp[zone]
                 
-                # Calculate with funnelling
-                cp_A_with_funnel = base_cp_A + factor * (max_funnel_cp_A - base_cp_A)
-                cp_B_with_funnel = base_cp_B + factor * (max_funnel_cp_B - base_cp_B)
-                cp_C_with_funnel = base_cp_C + factor * (max_funnel_cp_C - base_cp_C)
-                
-                # Calculate percentage increase
-                funnelling_increase_pct_A = (abs(cp_A_with_funnel) - abs(base_cp_A)) / abs(base_cp_A) * 100
-                funnelling_increase_pct_B = (abs(cp_B_with_funnel) - abs(base_cp_B)) / abs(base_cp_B) * 100
-                funnelling_increase_pct_C = (abs(cp_C_with_funnel) - abs(base_cp_C)) / abs(base_cp_C) * 100
+                # UK: Use fixed maximum values. EU: Apply ratios to the base Cpe values
+                if region == "United Kingdom":
+                    max_funnel_cp = uk_max_cp
+                else:
+                    max_funnel_cp = base_cp * EU_FUNNELLING_RATIOS[zone]
                 
-                # Update values with funnelling
-                cp_A = cp_A_with_funnel
-                cp_B = cp_B_with_funnel
-                cp_C = cp_C_with_funnel
+                # Update values with funnelling and record the percentage increase
+                cp[zone] = base_cp + factor * (max_funnel_cp - base_cp)
+                funnelling_increase_pct[zone] = (abs(cp[zone]) - abs(base_cp)) / abs(base_cp) * 100
         
         # Create result entries for this elevation
         # Show funnelling note whenever funnelling is applied, regardless of percentage
-        funnelling_note_A = f" (+{funnelling_increase_pct_A:.1f}% funnelling)" if has_funnelling else ""
-        funnelling_note_B = f" (+{funnelling_increase_pct_B:.1f}% funnelling)" if has_funnelling else ""
-        funnelling_note_C = f" (+{funnelling_increase_pct_C:.1f}% funnelling)" if has_funnelling else ""
+        funnelling_notes = {
+            zone: f" (+{pct:.1f}% funnelling)" for zone, pct in funnelling_increase_pct.items()
+        }
         
         # Add area note for EU calculations
         area_note = f" (Area: {loaded_area:.1f}m²)" if region != "United Kingdom" else ""
         
         elevation_results = [
-            {"Zone": "A", "cp,e": cp_A, "Description": f"Side Suction (Edge){funnelling_note_A}{area_note}"},
-            {"Zone": "B", "cp,e": cp_B, "Description": f"Side Suction{funnelling_note_B}{area_note}"},
-            {"Zone": "C", "cp,e": cp_C, "Description": f"Side Suction (Center){funnelling_note_C}{area_note}"},
-            {"Zone": "D", "cp,e": cp_D, "Description": f"Windward Face{area_note}"}
+            {"Zone": zone, "cp,e": cp[zone], "Description": f"{description}{funnelling_notes.get(zone, '')}{area_note}"}
+            for zone, description in ZONE_DESCRIPTIONS.items()
         ]
         
         # Store results for this elevation in the dictionary
@@ -506,7 +449,7 @@ def calculate_cpe(consider_funnelling=True):
     
     return results_by_elevation
 
-def display_elevation_results(elevation, cp_results, h, NS_dimension, EW_dimension):
+def display_elevation_results(elevation, cp_results, h, NS_dimension, EW_dimension, gaps=None):
     """
     Display results for a specific building elevation
     
@@ -516,6 +459,7 @@ def display_elevation_results(elevation, cp_results, h, NS_dimension, EW_dimensi
     - h: Building height
     - NS_dimension: North-South building dimension
     - EW_dimension: East-West building dimension
+    - gaps: Dictionary of gap per elevation when funnelling is considered, otherwise None
     """
     st.write(f"#### {elevation} Elevation")
     
@@ -532,20 +476,13 @@ def display_elevation_results(elevation, cp_results, h, NS_dimension, EW_dimensi
     # Calculate e (the smaller of b or 2h)
     e = min(b, 2*h)
     
-    # Check if funnelling is being considered
-    consider_funnelling = st.session_state.inputs.get("consider_funnelling", False)
-    
-    if consider_funnelling:
+    # Funnelling is being considered when gaps are given
+    if gaps is not None:
         # Get the gap value for this elevation
-        gap = st.session_state.inputs.get(f"{elevation.lower()}_gap", 10.0)
+        gap = gaps[elevation]
         
-        # Determine funnelling status
-        if gap <= e/4:
-            funnelling_status = "No Funnelling since **gap ≤ e/4**"
-        elif gap >= e:
-            funnelling_status = "No Funnelling since **gap ≥ e**"
-        else:
-            funnelling_status = "Funnelling Applied since **e/4 < gap < e**"
+        # Determine funnelling status: 0 for gap ≤ e/4, 1 for e/4 < gap < e, 2 for gap ≥ e
+        funnelling_status = FUNNELLING_STATUS[(gap > e/4) + (gap >= e)]
         
         # Display calculation info with funnelling status
         st.write(f"h/d = {h_d:.2f}, e = {e:.2f}m, gap = {gap:.2f}m ({funnelling_status})")
@@ -27,6 +27,20 @@ def detect_zone_E_and_visualise(session_state,
           crosswind_breadth (B1) = NS_dimension - east_offset - west_offset
     """
 
+    # Read base plan dims + base roof height from session_state
+    NS_dimension = float(session_state.inputs.get("NS_dimension", 20.0))  # Width of North/South elevations
+    EW_dimension = float(session_state.inputs.get("EW_dimension", 40.0))  # Width of East/West elevations  
+    z = float(session_state.inputs.get("z", 10.0))
+
+    return _detect_zone_E(NS_dimension, EW_dimension, z, inset_height,
+                          north_offset, south_offset, east_offset, west_offset)
+
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def _detect_zone_E(NS_dimension, EW_dimension, z, inset_height,
+                   north_offset, south_offset, east_offset, west_offset):
+    """Cached Zone E detection and 3D figure for the given plan dims, height and inset geometry."""
+
     # Colours
     TT_TopPlane = "rgb(223,224,225)"
     TT_Upper = "rgb(136,219,223)"
@@ -40,10 +54,7 @@ def detect_zone_E_and_visualise(session_state,
     west_offset  = max(0.0, float(west_offset  or 0.0))
     H1 = max(0.0, float(inset_height or 0.0))
 
-    # Read base plan dims + base roof height from session_state
-    NS_dimension = float(session_state.inputs.get("NS_dimension", 20.0))  # Width of North/South elevations
-    EW_dimension = float(session_state.inputs.get("EW_dimension", 40.0))  # Width of East/West elevations  
-    base_z = float(session_state.inputs.get("z", 10.0)) - H1 # roof plane z
+    base_z = z - H1 # roof plane z
 
     # Upper-storey footprint in plan coordinates
     # x-axis (North-South): x=0 is North, x=EW_dimension is South
@@ -535,7 +546,7 @@ def create_styled_inset_dataframe(results):
     Returns:
     --------
     pandas.io.formats.style.Styler
-        Styled dataframe ready for display with st.dataframe()
+        Styled dataframe; render with st.markdown(styled_df.to_html(), unsafe_allow_html=True)
     """
     # Create dataframe from results
     df = pd.DataFrame(results).T
@@ -5,6 +5,27 @@ import plotly.graph_objects as go
 import plotly.colors as pc
 from typing import List, Tuple
 from decimal import Decimal, ROUND_CEILING
+from functools import lru_cache
+
+# UK directional factor c_dir by wind angle (degrees clockwise from north)
+UK_DIRECTION_FACTORS = {
+    0: 0.78,
+    30: 0.73,
+    60: 0.73,
+    90: 0.74,
+    120: 0.73,
+    150: 0.80,
+    180: 0.85,
+    210: 0.93,
+    240: 1.00,
+    270: 0.99,
+    300: 0.91,
+    330: 0.82
+}
+
+# Building rotation choices (clockwise from north) offered with the UK directional factor
+ROTATION_OPTIONS = {f"{angle}°": angle for angle in range(0, 360, 30)}
+ROTATION_LABELS = tuple(ROTATION_OPTIONS)
 
 def get_direction_factor(rotation_angle, use_direction_factor=False):
     """
@@ -22,30 +43,14 @@ def get_direction_factor(rotation_angle, use_direction_factor=False):
     dict
         Dictionary mapping each cardinal direction to its c_dir value
     """
+    return dict(_direction_factors(rotation_angle, use_direction_factor))
+
+@lru_cache(maxsize=32)
+def _direction_factors(rotation_angle, use_direction_factor):
+    """Memoized (direction, c_dir) pairs for get_direction_factor; a tuple so the cached value can't be mutated."""
     if not use_direction_factor:
         # If not using directional factor, return 1.0 for all directions
-        return {
-            "North": 1.0,
-            "East": 1.0,
-            "South": 1.0,
-            "West": 1.0
-        }
-    
-    # UK directional factors by angle (clockwise from north)
-    uk_direction_factors = {
-        0: 0.78,
-        30: 0.73,
-        60: 0.73,
-        90: 0.74,
-        120: 0.73,
-        150: 0.80,
-        180: 0.85,
-        210: 0.93,
-        240: 1.00,
-        270: 0.99,
-        300: 0.91,
-        330: 0.82
-    }
+        return (("North", 1.0), ("East", 1.0), ("South", 1.0), ("West", 1.0))
     
     # Map each cardinal direction to an angle after considering building rotation
     direction_angles = {
@@ -56,13 +61,13 @@ def get_direction_factor(rotation_angle, use_direction_factor=False):
     }
     
     # Get the nearest defined angle for each direction
-    direction_factors = {}
+    direction_factors = []
     for direction, angle in direction_angles.items():
         # Find the nearest angle in the UK factors table
-        nearest_angle = min(uk_direction_factors.keys(), key=lambda x: min(abs(x - angle), abs(x - angle + 360), abs(x - angle - 360)))
-        direction_factors[direction] = uk_direction_factors[nearest_angle]
+        nearest_angle = min(UK_DIRECTION_FACTORS.keys(), key=lambda x: min(abs(x - angle), abs(x - angle + 360), abs(x - angle - 360)))
+        direction_factors.append((direction, UK_DIRECTION_FACTORS[nearest_angle]))
     
-    return direction_factors
+    return tuple(direction_factors)
 
 def calculate_pressure_data(session_state, results_by_direction):
     """
@@ -71,18 +76,38 @@ def calculate_pressure_data(session_state, results_by_direction):
     - Summary rows include only zones that are present on that elevation (using
       the d/e rules used for plotting), and Zone E is included only for the elevations
       where detect_zone_E indicated zone_E present. The cp,e for zone E is always -2.0.
+
+    Reads the session inputs and hands plain values to the cached
+    _calculate_pressure_data, so repeat calls within and across reruns are cheap.
     """
-    # Extract dimensions and peak velocity pressure
-    h = session_state.inputs.get("z", 10.0)  # Building height
-    q_p = session_state.results.get("q_p", 1000.0)  # Peak velocity pressure in N/m²
+    inputs = session_state.inputs
 
-    # Plan dimensions (needed to determine which zones appear)
-    NS_dimension = session_state.inputs.get("NS_dimension", 20.0)
-    EW_dimension = session_state.inputs.get("EW_dimension", 40.0)
+    # (direction, zones, cp,e values) per elevation: a cheap cache key, unlike the DataFrames
+    cp_by_direction = tuple(
+        (direction, tuple(cp_df['Zone']), tuple(cp_df['cp,e']))
+        for direction, cp_df in results_by_direction.items()
+    )
 
+    return _calculate_pressure_data(
+        inputs.get("z", 10.0),  # Building height
+        session_state.results.get("q_p", 1000.0),  # Peak velocity pressure in N/m²
+        inputs.get("NS_dimension", 20.0),
+        inputs.get("EW_dimension", 40.0),
+        inputs.get("use_direction_factor", False),
+        inputs.get("building_rotation", 0),
+        session_state.get("inset_results", None),
+        cp_by_direction,
+    )
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def _calculate_pressure_data(h, q_p, NS_dimension, EW_dimension, use_direction_factor,
+                             rotation_angle, inset_results, cp_by_direction):
+    """
+    Compute the pressure data for calculate_pressure_data from explicit inputs.
+
+    Returns (summary rows, global (min, max) net pressure in kPa, zone pressures by direction).
+    """
     # Get directional factors
-    use_direction_factor = session_state.inputs.get("use_direction_factor", False)
-    rotation_angle = session_state.inputs.get("building_rotation", 0)
     direction_factors = get_direction_factor(rotation_angle, use_direction_factor)
 
     # Define cp,i values
@@ -120,7 +145,7 @@ def calculate_pressure_data(session_state, results_by_direction):
         return zone_names
 
     # Process each direction (elevation)
-    for direction, cp_df in results_by_direction.items():
+    for direction, cp_zones, cp_values in cp_by_direction:
         c_dir = direction_factors.get(direction, 1.0)
         adjusted_qp = q_p * c_dir
 
@@ -135,11 +160,10 @@ def calculate_pressure_data(session_state, results_by_direction):
         zone_pressures_by_direction[direction] = {}
 
         # 1) First pass: compute/store pressures for any A-D rows present in cp_df
-        for _, row in cp_df.iterrows():
-            zone = row.get('Zone')
+        for zone, cp_e in zip(cp_zones, cp_values):
             if zone not in ['A', 'B', 'C', 'D']:
                 continue  # skip unknown zones here
-            cp_e = round(row.get('cp,e', 0.0), 2)
+            cp_e = round(cp_e, 2)
             we = adjusted_qp * cp_e
             cp_i_used = cp_i_positive if cp_e < 0 else cp_i_negative
             wi = adjusted_qp * cp_i_used
@@ -160,7 +184,7 @@ def calculate_pressure_data(session_state, results_by_direction):
             }
 
         # ----- Include Zone E if detect reports it for this elevation -----
-        detect_res = session_state.get("inset_results", None)
+        detect_res = inset_results
         zone_e_present = False
         if isinstance(detect_res, dict) and detect_res.get(direction):
             dr = detect_res[direction]
@@ -292,19 +316,48 @@ def plot_elevation_with_pressures(session_state, results_by_direction):
     NS_dimension = session_state.inputs.get("NS_dimension", 20.0)
     EW_dimension = session_state.inputs.get("EW_dimension", 40.0)
     
-    # Get directional factors
-    use_direction_factor = session_state.inputs.get("use_direction_factor", False)
-    rotation_angle = session_state.inputs.get("building_rotation", 0)
-    direction_factors = get_direction_factor(rotation_angle, use_direction_factor)
-    
-    # Create a continuous color scale for pressure
-    colorscale = pc.sequential.Teal_r
-    
-    # Get pre-calculated pressure data
+    # Get pre-calculated pressure data (directional factors are already applied)
     _, global_pressure_range, zone_pressures_by_direction = calculate_pressure_data(
         session_state, results_by_direction
     )
     
+    return _create_elevation_pressure_figures(
+        h, NS_dimension, EW_dimension,
+        tuple(results_by_direction.keys()),
+        zone_pressures_by_direction,
+        global_pressure_range,
+    )
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def _create_elevation_pressure_figures(h, NS_dimension, EW_dimension, directions,
+                                       zone_pressures_by_direction, global_pressure_range):
+    """
+    Build the elevation pressure figures for plot_elevation_with_pressures.
+    
+    Takes only plain values so the figures can be cached; reruns that leave the
+    geometry and zone pressures unchanged reuse them instead of rebuilding.
+    
+    Parameters:
+    -----------
+    h : float
+        Building height
+    NS_dimension, EW_dimension : float
+        Plan dimensions of the building
+    directions : tuple
+        Elevation names, in plotting order
+    zone_pressures_by_direction : dict
+        Net zone pressures per direction, from calculate_pressure_data
+    global_pressure_range : tuple
+        (min, max) net pressure in kPa across all zones, for the colour scale
+    
+    Returns:
+    --------
+    dict
+        Dictionary of plotly figures for each elevation
+    """
+    # Create a continuous color scale for pressure
+    colorscale = pc.sequential.Teal_r
+    
     # Unpack global pressure range (they are already in kPa)
     global_min_suction_kpa, global_max_suction_kpa = global_pressure_range
     
@@ -312,10 +365,7 @@ def plot_elevation_with_pressures(session_state, results_by_direction):
     figures = {}
     
     # Process each direction (elevation)
-    for direction, cp_df in results_by_direction.items():
-        # Get directional factor for this direction
-        c_dir = direction_factors.get(direction, 1.0)
-        
+    for direction in directions:
         # Set up width and height based on direction
         if direction in ["North", "South"]:
             width = NS_dimension
@@ -623,10 +673,6 @@ def create_3d_wind_visualisation(session_state, results_by_direction, mode="suct
     plotly.graph_objects.Figure
         3D visualisation of the building with wind zones and pressure values
     """
-    import plotly.graph_objects as go
-    import numpy as np
-    import plotly.colors as colors
-    
     # Extract building dimensions
     NS_dimension = session_state.inputs.get("NS_dimension", 20.0)
     EW_dimension = session_state.inputs.get("EW_dimension", 40.0)
@@ -782,7 +828,7 @@ def create_3d_wind_visualisation(session_state, results_by_direction, mode="suct
         normalized_value = max(0, min(1, normalized_value))  # Clamp between 0 and 1
         
         # Get color from the Teal colorscale
-        zone_color = colors.sample_colorscale(blues_colorscale, [normalized_value])[0]
+        zone_color = pc.sample_colorscale(blues_colorscale, [normalized_value])[0]
         
         # Add zone face with appropriate color (single mesh with 2 triangles)
         fig.add_trace(go.Mesh3d(
@@ -996,9 +1042,12 @@ def create_3d_wind_visualisation(session_state, results_by_direction, mode="suct
 
     return fig
 
+@st.fragment
 def create_wind_visualisation_ui(session_state, results_by_direction):
     """
     Create an interactive UI for toggling between pressure and suction visualisation modes
+
+    Runs as a fragment, so switching the mode only reruns this section.
     
     Parameters:
     -----------
@@ -1011,8 +1060,6 @@ def create_wind_visualisation_ui(session_state, results_by_direction):
     --------
     None (renders UI components directly)
     """
-    import streamlit as st
-    
     # Create toggle for pressure/suction mode
     mode = st.radio(
         "Visualisation Mode:",
@@ -2,19 +2,14 @@
 
 import math
 import streamlit as st
+from calc_engine.eu.roughness import TERRAIN_PARAMS
 
-def calculate_qp(z, terrain_category, v_b, rho_air=1.25, c_o=1.0):
+def calculate_peak_pressure_terms(z, terrain_category, v_b, rho_air=1.25, c_o=1.0):
     """
-    Calculate the peak velocity pressure q_p(z) for a given height z and terrain category,
-    based on the EU standard (BS EN 1991-1-4).
+    Calculate q_p(z) together with the intermediate terms it is built from.
     
-    The peak velocity pressure q_p(z) is calculated as:
-    q_p(z) = [1 + 7 * I_v(z)] * 0.5 * rho * v_m^2(z)
-    
-    where:
-    - I_v(z) is the turbulence intensity
-    - rho is the air density (typically 1.25 kg/m³)
-    - v_m(z) is the mean wind velocity
+    c_r(z) and I_v(z) both depend on ln(max(z, z_min) / z0), so that term is
+    evaluated once and shared rather than recomputed for each factor.
     
     Parameters:
     -----------
@@ -31,55 +26,73 @@ def calculate_qp(z, terrain_category, v_b, rho_air=1.25, c_o=1.0):
     
     Returns:
     --------
-    q_p : float
-        The peak velocity pressure at height z (in N/m²)
+    terms : dict
+        k_r, c_r, v_m, i_vz and q_p for height z
     """
-    # Define terrain parameters for each category
-    terrain_params = {
-        '0': {'z_0': 0.003, 'z_min': 1},
-        'I': {'z_0': 0.01, 'z_min': 1},
-        'II': {'z_0': 0.05, 'z_min': 2},
-        'III': {'z_0': 0.3, 'z_min': 5},
-        'IV': {'z_0': 1.0, 'z_min': 10},
-    }
-    
     # Ensure terrain_category is a string and in correct form for lookup
     terrain_category = str(terrain_category).strip()
-    if terrain_category not in terrain_params:
+    if terrain_category not in TERRAIN_PARAMS:
         raise ValueError("Invalid terrain category. Must be one of: 0, I, II, III, IV.")
     
     # Retrieve the roughness length and the minimum height for the selected category
-    z_0 = terrain_params[terrain_category]['z_0']
-    z_min = terrain_params[terrain_category]['z_min']
+    z_0 = TERRAIN_PARAMS[terrain_category]['z0']
+    z_min = TERRAIN_PARAMS[terrain_category]['z_min']
     
     # Calculate the terrain factor k_r using Equation (4.5)
     z0_II = 0.05  # roughness length for terrain category II as reference
     k_r = 0.19 * (z_0 / z0_II) ** 0.07
-    st.session_state.results["k_r"] = k_r
     
-    # Calculate roughness factor c_r(z)
-    if z < z_min:
-        # For z below the minimum height, use the value at z_min
-        c_r = k_r * math.log(z_min / z_0)
-    else:
-        # For z between z_min and z_max (and above), use the logarithmic formula
-        c_r = k_r * math.log(z / z_0)
+    # Below z_min both c_r(z) and I_v(z) take their value at z_min
+    log_z = math.log(max(z, z_min) / z_0)
     
-    # Calculate the mean wind velocity v_m(z)
+    # Calculate roughness factor c_r(z) and the mean wind velocity v_m(z)
+    c_r = k_r * log_z
     v_m = v_b * c_r * c_o
     
     # Calculate the turbulence intensity I_v(z)
     k_I = 1.0  # turbulence factor (default value is 1.0)
-    
-    if z < z_min:
-        i_vz = k_I / (c_o * math.log(z_min / z_0))
-    else:
-        i_vz = k_I / (c_o * math.log(z / z_0))
+    i_vz = k_I / (c_o * log_z)
     
     # Calculate the peak velocity pressure q_p(z)
     q_p = (1 + 7 * i_vz) * 0.5 * rho_air * (v_m ** 2)
     
-    return q_p
+    return {"k_r": k_r, "c_r": c_r, "v_m": v_m, "i_vz": i_vz, "q_p": q_p}
+
+def calculate_qp(z, terrain_category, v_b, rho_air=1.25, c_o=1.0):
+    """
+    Calculate the peak velocity pressure q_p(z) for a given height z and terrain category,
+    based on the EU standard (BS EN 1991-1-4).
+    
+    The peak velocity pressure q_p(z) is calculated as:
+    q_p(z) = [1 + 7 * I_v(z)] * 0.5 * rho * v_m^2(z)
+    
+    where:
+    - I_v(z) is the turbulence intensity
+    - rho is the air density (typically 1.25 kg/m³)
+    - v_m(z) is the mean wind velocity
+    
+    Parameters:
+    -----------
+    z : float
+        Height above ground (in m)
+    terrain_category : str
+        The terrain category identifier. Valid options are '0', 'I', 'II', 'III', or 'IV'.
+    v_b : float
+        Basic wind velocity (in m/s)
+    rho_air : float, optional
+        Air density (in kg/m³), default is 1.25
+    c_o : float, optional
+        Orography factor, default is 1.0
+    
+    Returns:
+    --------
+    q_p : float
+        The peak velocity pressure at height z (in N/m²)
+    """
+    terms = calculate_peak_pressure_terms(z, terrain_category, v_b, rho_air, c_o)
+    st.session_state.results["k_r"] = terms["k_r"]
+    
+    return terms["q_p"]
 
 def display_eu_peak_pressure_calculation(st, z_minus_h_dis, terrain_category, v_b, rho_air, c_o=1.0):
     """Display EU peak pressure calculation with explanation.
@@ -118,45 +131,19 @@ def display_eu_peak_pressure_calculation(st, z_minus_h_dis, terrain_category, v_
         # Store the value in session state
         st.session_state.inputs["c_o"] = c_o
         
-    # Calculate basic wind pressure
-    q_b = 0.5 * rho_air * (v_b ** 2)
-    st.session_state.inputs["q_b"] = q_b
-    
-    # Calculate roughness factor
-    from calc_engine.eu.roughness import calculate_crz
-    c_rz = calculate_crz(z_minus_h_dis, terrain_category)
-    st.session_state.inputs["c_rz"] = c_rz
-    
-    # Calculate mean wind velocity
-    v_m = v_b * c_rz * c_o
-    st.session_state.inputs["v_mean"] = v_m
-    
-    # Calculate turbulence intensity
-    terrain_params = {
-        '0': {'z_0': 0.003, 'z_min': 1},
-        'I': {'z_0': 0.01, 'z_min': 1},
-        'II': {'z_0': 0.05, 'z_min': 2},
-        'III': {'z_0': 0.3, 'z_min': 5},
-        'IV': {'z_0': 1.0, 'z_min': 10},
-    }
-    z_0 = terrain_params[terrain_category]['z_0']
-    st.session_state.results["z_0"] = z_0
-    z_min = terrain_params[terrain_category]['z_min']
-    st.session_state.results["z_min"] = z_min
-    k_I = 1.0
-    st.session_state.results["k_I"] = k_I
-    
-    if z_minus_h_dis < z_min:
-        i_vz = k_I / (c_o * math.log(z_min / z_0))
-    else:
-        i_vz = k_I / (c_o * math.log(z_minus_h_dis / z_0))
-    
+    # Calculate c_r(z), v_m(z), I_v(z) and q_p(z) in a single pass
+    terms = calculate_peak_pressure_terms(z_minus_h_dis, terrain_category, v_b, rho_air, c_o)
+    c_rz = terms["c_r"]  # c_r(z) itself is stored by display_eu_roughness_calculation
+    v_m = terms["v_m"]
+    i_vz = terms["i_vz"]
+    q_p = terms["q_p"]
+    
+    st.session_state.results["k_r"] = terms["k_r"]
+    st.session_state.results["z_0"] = TERRAIN_PARAMS[terrain_category]['z0']
+    st.session_state.results["z_min"] = TERRAIN_PARAMS[terrain_category]['z_min']
+    st.session_state.results["k_I"] = 1.0
     st.session_state.results["i_vz"] = i_vz
     
-    # Calculate peak velocity pressure using your existing function
-    q_p = calculate_qp(z_minus_h_dis, terrain_category, v_b, rho_air, c_o)
-    st.session_state.inputs["q_p"] = q_p
-    
     # Display calculation parameters and results
     st.write(f"Roughness factor, $c_r(z) = {c_rz:.3f}$")
     st.write(f"Orography factor, $c_o(z) = {c_o:.3f}$")
@@ -1,6 +1,16 @@
 import math
 import streamlit as st
 
+# Table 4.1 - roughness length z0 and minimum height z_min (m) per terrain category
+TERRAIN_PARAMS = {
+    '0': {'z0': 0.003, 'z_min': 1},
+    'I': {'z0': 0.01, 'z_min': 1},
+    'II': {'z0': 0.05, 'z_min': 2},
+    'III': {'z0': 0.3, 'z_min': 5},
+    'IV': {'z0': 1.0, 'z_min': 10},
+}
+
+@st.cache_data(show_spinner=False)
 def calculate_crz(z, terrain_category):
     """
     Calculate the roughness factor c_r(z) for a given height z and terrain category,
@@ -42,23 +52,14 @@ def calculate_crz(z, terrain_category):
         The roughness factor at height z.
     """
 
-    # Define terrain parameters for each category
-    terrain_params = {
-        '0': {'z0': 0.003, 'z_min': 1},
-        'I': {'z0': 0.01, 'z_min': 1},
-        'II': {'z0': 0.05, 'z_min': 2},
-        'III': {'z0': 0.3, 'z_min': 5},
-        'IV': {'z0': 1.0, 'z_min': 10},
-    }
-
     # Ensure terrain_category is a string and in uppercase form for lookup.
     terrain_category = str(terrain_category).strip()
-    if terrain_category not in terrain_params:
+    if terrain_category not in TERRAIN_PARAMS:
         raise ValueError("Invalid terrain category. Must be one of: 0, I, II, III, IV.")
 
     # Retrieve the roughness length and the minimum height for the selected category.
-    z0 = terrain_params[terrain_category]['z0']
-    z_min = terrain_params[terrain_category]['z_min']
+    z0 = TERRAIN_PARAMS[terrain_category]['z0']
+    z_min = TERRAIN_PARAMS[terrain_category]['z_min']
     z_max = 200.0  # maximum height to which the formula applies
 
     # Calculate the terrain factor k_r using Equation 4.5
@@ -93,15 +94,8 @@ def display_eu_roughness_calculation(st, z_minus_h_dis, terrain_category):
     st.session_state.inputs["c_rz"] = c_rz
     
     # Get terrain parameters for explanation
-    terrain_params = {
-        '0': {'z0': 0.003, 'z_min': 1},
-        'I': {'z0': 0.01, 'z_min': 1},
-        'II': {'z0': 0.05, 'z_min': 2},
-        'III': {'z0': 0.3, 'z_min': 5},
-        'IV': {'z0': 1.0, 'z_min': 10},
-    }
-    z0 = terrain_params[terrain_category]['z0']
-    z_min = terrain_params[terrain_category]['z_min']
+    z0 = TERRAIN_PARAMS[terrain_category]['z0']
+    z_min = TERRAIN_PARAMS[terrain_category]['z_min']
     z0_II = 0.05
     kr = 0.19 * (z0 / z0_II) ** 0.07
     
@@ -1,8 +1,9 @@
 # contour_plots.py
+import os
 import pandas as pd
 import plotly.graph_objects as go
 import numpy as np
-from scipy.interpolate import griddata
+from scipy.interpolate import griddata, LinearNDInterpolator, NearestNDInterpolator
 import streamlit as st
 
 # -----------------------
@@ -68,16 +69,70 @@ PLOT_CONFIGS = {
 # Common y-axis name
 Y_AXIS_NAME = "Effective height (m)"
 
+# Workbook holding the digitised NA.3 - NA.8 contour data
+CONTOUR_DATA_PATH = "calc_engine/uk/contour_data.xlsx"
+
+# Per-sheet Parquet copies of the workbook, read in preference to the .xlsx
+CONTOUR_PARQUET_DIR = "calc_engine/uk/contour_data"
+
 # -----------------------
 # Data Loading Function
 # -----------------------
-@st.cache_data(show_spinner=False)
-def load_contour_data(excel_file_path="calc_engine/uk/contour_data.xlsx"):
+def load_contour_data(excel_file_path=CONTOUR_DATA_PATH, parquet_dir=CONTOUR_PARQUET_DIR):
     """
-    Load contour data from an Excel file.
+    Load contour data, preferring the Parquet export over the Excel workbook.
+    
+    The parsed data is cached across reruns and sessions as a shared, read-only
+    object, and only re-read when the source files' modification times change.
+    The workbook is used when any sheet's Parquet file is missing.
     
     Args:
         excel_file_path (str): Path to the Excel file containing contour data
+        parquet_dir (str): Directory holding one <sheet>.parquet file per sheet
+        
+    Returns:
+        dict: Dictionary of DataFrames for each sheet
+    """
+    parquet_paths = [_parquet_path(parquet_dir, sheet_name) for sheet_name in PLOT_CONFIGS.keys()]
+    if all(os.path.exists(path) for path in parquet_paths):
+        mtime = max(os.path.getmtime(path) for path in parquet_paths)
+        return _read_contour_parquet(parquet_dir, mtime)
+    
+    try:
+        mtime = os.path.getmtime(excel_file_path)
+    except OSError:
+        mtime = None
+    return _read_contour_workbook(excel_file_path, mtime)
+
+def _parquet_path(parquet_dir, sheet_name):
+    """Return the Parquet file path for a sheet."""
+    return os.path.join(parquet_dir, f"{sheet_name}.parquet")
+
+@st.cache_resource(show_spinner=False)
+def _read_contour_parquet(parquet_dir, mtime):
+    """
+    Read the per-sheet Parquet export written by export_contour_parquet.
+    
+    Args:
+        parquet_dir (str): Directory holding one <sheet>.parquet file per sheet
+        mtime (float): Latest file modification time, used only as part of the cache key
+        
+    Returns:
+        dict: Dictionary of DataFrames for each sheet
+    """
+    return {
+        sheet_name: pd.read_parquet(_parquet_path(parquet_dir, sheet_name))
+        for sheet_name in PLOT_CONFIGS.keys()
+    }
+
+@st.cache_resource(show_spinner=False)
+def _read_contour_workbook(excel_file_path, mtime):
+    """
+    Parse every NA.x sheet of the contour workbook into x, y, z DataFrames.
+    
+    Args:
+        excel_file_path (str): Path to the Excel file containing contour data
+        mtime (float): File modification time, used only as part of the cache key
         
     Returns:
         dict: Dictionary of DataFrames for each sheet
@@ -113,6 +168,103 @@ def load_contour_data(excel_file_path="calc_engine/uk/contour_data.xlsx"):
     
     return dataframes
 
+def export_contour_parquet(excel_file_path=CONTOUR_DATA_PATH, parquet_dir=CONTOUR_PARQUET_DIR):
+    """
+    Write each sheet of the contour workbook to <parquet_dir>/<sheet>.parquet.
+    
+    Re-run this after editing the workbook so load_contour_data picks up the
+    change; the app reads the Parquet files whenever all of them are present.
+    
+    Args:
+        excel_file_path (str): Path to the Excel file containing contour data
+        parquet_dir (str): Directory to write the Parquet files to
+    """
+    os.makedirs(parquet_dir, exist_ok=True)
+    dataframes = _read_contour_workbook(excel_file_path, os.path.getmtime(excel_file_path))
+    for sheet_name, df in dataframes.items():
+        df.reset_index(drop=True).to_parquet(_parquet_path(parquet_dir, sheet_name), index=False)
+
+# -----------------------
+# Point Interpolation
+# -----------------------
+def _hash_contour_frame(df):
+    """Cache key for an x, y, z contour DataFrame: the raw bytes of its values.
+    Much cheaper than Streamlit's generic DataFrame hashing for these small frames."""
+    return df.to_numpy().tobytes()
+
+# hash_funcs for cached functions that take contour DataFrames (or dicts of them)
+CONTOUR_HASH_FUNCS = {pd.DataFrame: _hash_contour_frame}
+
+@st.cache_resource(show_spinner=False, max_entries=16, hash_funcs=CONTOUR_HASH_FUNCS)
+def _point_interpolators(df, sheet_name):
+    """
+    Build linear and nearest-neighbour interpolators for a sheet in log space.
+    
+    The Delaunay triangulation is computed once per sheet rather than on every
+    griddata call, so single-point lookups reduce to a triangle search.
+    
+    Args:
+        df (DataFrame): DataFrame containing the contour data (x, y, z columns)
+        sheet_name (str): Name of the sheet, used only as part of the cache key
+        
+    Returns:
+        tuple: (LinearNDInterpolator, NearestNDInterpolator)
+    """
+    points = np.column_stack((np.log10(df['x']), np.log10(df['y'])))
+    values = df['z'].to_numpy()
+    return LinearNDInterpolator(points, values), NearestNDInterpolator(points, values)
+
+def _interpolate_point(df, sheet_name, x, y):
+    """
+    Interpolate z at (x, y), falling back to the nearest point outside the hull.
+    
+    Args:
+        df (DataFrame): DataFrame containing the contour data (x, y, z columns)
+        sheet_name (str): Name of the sheet/plot
+        x (float): X-coordinate value
+        y (float): Y-coordinate value
+        
+    Returns:
+        float: Interpolated z value
+    """
+    linear, nearest = _point_interpolators(df, sheet_name)
+    log_x, log_y = np.log10(x), np.log10(y)
+    interp_z = linear(log_x, log_y)
+    if np.isnan(interp_z):
+        interp_z = nearest(log_x, log_y)
+    return float(interp_z)
+
+# -----------------------
+# Contour Grid
+# -----------------------
+@st.cache_data(show_spinner=False, max_entries=16, hash_funcs=CONTOUR_HASH_FUNCS)
+def _contour_grid(df, sheet_name):
+    """
+    Interpolate a sheet's scattered contour points onto the log-spaced plot grid.
+    
+    The grid depends only on the sheet, so it is built once and shared by every
+    plot of that sheet whatever the selected point.
+    
+    Args:
+        df (DataFrame): DataFrame containing the contour data (x, y, z columns)
+        sheet_name (str): Name of the sheet/plot
+        
+    Returns:
+        tuple: (x_grid, y_grid, Z_grid) arrays for go.Contour
+    """
+    config = PLOT_CONFIGS[sheet_name]
+    x_min, x_max = config["x_min"], config["x_max"]
+    y_min, y_max = config["y_min"], config["y_max"]
+    
+    grid_density = 200
+    x_grid = np.logspace(np.log10(x_min), np.log10(x_max), grid_density)
+    y_grid = np.logspace(np.log10(y_min), np.log10(y_max), grid_density)
+    X_grid, Y_grid = np.meshgrid(x_grid, y_grid)
+    
+    points = np.column_stack((np.log10(df['x']), np.log10(df['y'])))
+    Z_grid = griddata(points, df['z'], (np.log10(X_grid), np.log10(Y_grid)), method='linear')
+    return x_grid, y_grid, Z_grid
+
 # -----------------------
 # Single Contour Plot Function
 # -----------------------
@@ -120,6 +272,10 @@ def create_contour_plot(df, sheet_name, x_input, y_input):
     """
     Create a contour plot for a specific sheet with x and y inputs.
     
+    The interpolated contour grid comes from the cached _contour_grid, so each
+    call only assembles the figure and crosshair; that is cheaper than copying
+    a cached figure out of st.cache_data.
+    
     Args:
         df (DataFrame): DataFrame containing the contour data (x, y, z columns)
         sheet_name (str): Name of the sheet/plot to create
@@ -145,24 +301,11 @@ def create_contour_plot(df, sheet_name, x_input, y_input):
         )
         return fig, None
     
-    grid_density = 200
-    x_grid = np.logspace(np.log10(x_min), np.log10(x_max), grid_density)
-    y_grid = np.logspace(np.log10(y_min), np.log10(y_max), grid_density)
-    X_grid, Y_grid = np.meshgrid(x_grid, y_grid)
-    
-    points = np.column_stack((np.log10(df['x']), np.log10(df['y'])))
-    Z_grid = griddata(points, df['z'], (np.log10(X_grid), np.log10(Y_grid)), method='linear')
-    
-    def get_interpolated_z(x, y):
-        log_x, log_y = np.log10(x), np.log10(y)
-        interp_z = griddata(points, df['z'], np.array([[log_x, log_y]]), method='linear')[0]
-        if np.isnan(interp_z):
-            interp_z = griddata(points, df['z'], np.array([[log_x, log_y]]), method='nearest')[0]
-        return interp_z
+    x_grid, y_grid, Z_grid = _contour_grid(df, sheet_name)
     
     interpolated_z = None
     if x_min <= x_input <= x_max and y_min <= y_input <= y_max:
-        interpolated_z = get_interpolated_z(x_input, y_input)
+        interpolated_z = _interpolate_point(df, sheet_name, x_input, y_input)
     
     fig = go.Figure()
     
@@ -241,10 +384,14 @@ def create_contour_plot(df, sheet_name, x_input, y_input):
 # -----------------------
 # Functions to get interpolated values
 # -----------------------
+@st.cache_data(show_spinner=False, max_entries=256, hash_funcs=CONTOUR_HASH_FUNCS)
 def get_interpolated_value(datasets, sheet_name, x_input, y_input):
     """
     Get interpolated value for a specific sheet.
     
+    Memoized per (datasets, sheet_name, x_input, y_input), so repeated lookups
+    at the same query point while other inputs change are a hash hit.
+    
     Args:
         datasets (dict): Dictionary of DataFrames for each sheet
         sheet_name (str): Name of the sheet/plot
@@ -256,16 +403,16 @@ def get_interpolated_value(datasets, sheet_name, x_input, y_input):
     """
     config = PLOT_CONFIGS[sheet_name]
     x_min, x_max = config["x_min"], config["x_max"]
+    y_min, y_max = config["y_min"], config["y_max"]
     
     # Clamp x_input to valid range
     x_input = max(x_min, min(x_input, x_max))
     
     df = datasets[sheet_name]
-    _, interpolated_z = create_contour_plot(df, sheet_name, x_input, y_input)
+    if df.empty or not y_min <= y_input <= y_max:
+        return None
     
-    if interpolated_z is not None:
-        return round(interpolated_z, 3)
-    return None
+    return round(_interpolate_point(df, sheet_name, x_input, y_input), 3)
 
 def get_all_interpolated_values(datasets, y_input, x_upwind, x_town):
     """
@@ -363,3 +510,6 @@ def display_all_plots(st_container, datasets, y_input, x_upwind, x_town):
             
             if i < 5:
                 st.markdown("---")
+
+if __name__ == "__main__":
+    export_contour_parquet()
@@ -1,4 +1,5 @@
 # Add to main.py if wanting to include directional factor
+# (with `from calc_engine.common.pressure_summary import ROTATION_OPTIONS, ROTATION_LABELS` among its imports)
 # Wind pressure parameters
 st.markdown("---")
 st.header("Wind Directional Factor, $c_{dir}$")
@@ -18,30 +19,15 @@ if st.session_state.inputs.get("region") == "United Kingdom":
     with col1:        
         # Building rotation dropdown (only shown if directional factor is enabled)
         if use_direction_factor:
-            rotation_options = {
-                "0°": 0,
-                "30°": 30,
-                "60°": 60, 
-                "90°": 90,
-                "120°": 120,
-                "150°": 150,
-                "180°": 180,
-                "210°": 210,
-                "240°": 240,
-                "270°": 270,
-                "300°": 300,
-                "330°": 330
-            }
-            
             rotation_label = st.selectbox(
                 "Building rotation (clockwise from north)",
-                options=list(rotation_options.keys()),
+                options=ROTATION_LABELS,
                 index=0,
                 help="Rotate the building orientation clockwise from north"
             )
             
             # Store the selected rotation angle in session state
-            st.session_state.inputs["building_rotation"] = rotation_options[rotation_label]
+            st.session_state.inputs["building_rotation"] = ROTATION_OPTIONS[rotation_label]
             
             # Display the directional factors for the selected rotation
             st.write("Directional factors for the current orientation:")
@@ -54,10 +40,7 @@ if st.session_state.inputs.get("region") == "United Kingdom":
             )
             
             # Display factors as a table
-            factor_data = pd.DataFrame({
-                "Direction": list(direction_factors.keys()),
-                "c_dir": list(direction_factors.values())
-            })
+            factor_data = pd.DataFrame(list(direction_factors.items()), columns=["Direction", "c_dir"])
             st.dataframe(factor_data, hide_index=True, height=35*len(factor_data)+38)
 
         else:
@@ -1,5 +1,8 @@
 import streamlit as st
 
+from calc_engine.uk.contour_plots import get_interpolated_value, display_single_plot
+from calc_engine.common.util import store_session_value
+
 def display_contour_plot_with_override(st, datasets, plot_name, x_value, y_value, description, value_label, store_key=None):
     """Display a contour plot with consistent formatting and override option.
     
@@ -16,9 +19,6 @@ def display_contour_plot_with_override(st, datasets, plot_name, x_value, y_value
     Returns:
         float: The interpolated or manually entered value
     """
-    from calc_engine.uk.contour_plots import get_interpolated_value, display_single_plot
-    from calc_engine.common.util import store_session_value
-    
     st.markdown(f"##### {plot_name} Plot ({description})")
     
     # Allow user to override the calculated value
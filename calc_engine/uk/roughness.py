@@ -12,7 +12,7 @@ def calculate_uk_roughness(st, datasets):
         float: The calculated roughness factor
     """
     # Get necessary parameters from session state
-    z_minus_h_dis = st.session_state.inputs.get("z_minus_h_dis", 10.0)
+    z_minus_h_dis = st.session_state.results.get("z_minus_h_dis", 10.0)
     d_sea = st.session_state.inputs.get("d_sea", 60.0)
     terrain = st.session_state.inputs.get("terrain_category", "").lower()
     
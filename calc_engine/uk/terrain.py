@@ -1,10 +1,16 @@
+# Terrain categories according to UK National Annex
+TERRAIN_CATEGORIES = {
+    "Sea": "Open sea, lakes and coastal areas exposed to open sea",
+    "Country": "Flat open country without obstacles",
+    "Town": "Town or city terrain with closely spaced obstacles"
+}
+
+# Selectbox label ("<code> - <description>") shown for each terrain code
+DISPLAY_LABELS = {code: f"{code} - {desc}" for code, desc in TERRAIN_CATEGORIES.items()}
+
 def get_terrain_categories():
     """
     Returns terrain categories according to UK National Annex.
     Keys are the simplified codes and values are the detailed descriptions.
     """
-    return {
-        "Sea": "Open sea, lakes and coastal areas exposed to open sea",
-        "Country": "Flat open country without obstacles",
-        "Town": "Town or city terrain with closely spaced obstacles"
-    }
+    return dict(TERRAIN_CATEGORIES)
@@ -0,0 +1,31 @@
+import streamlit as st
+
+
+@st.cache_resource(show_spinner=False)
+def load_image_bytes(path):
+    """Return an image file's bytes, read once and shared read-only across reruns and sessions."""
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def render_educational_expander(title, content, image=None, image_columns=None, **image_kwargs):
+    """
+    Render a collapsed educational expander with the content HTML and an optional image.
+
+    The image sits above the content, or beside it when image_columns gives the
+    (content, image) column widths.
+    """
+    content_html = f'<div class="educational-content">{content}</div>'
+    st.markdown('<div class="educational-expander">', unsafe_allow_html=True)
+    with st.expander(title, expanded=False):
+        if image and image_columns:
+            content_col, image_col = st.columns(image_columns)
+            with content_col:
+                st.markdown(content_html, unsafe_allow_html=True)
+            with image_col:
+                st.image(load_image_bytes(image), **image_kwargs)
+        else:
+            if image:
+                st.image(load_image_bytes(image), **image_kwargs)
+            st.markdown(content_html, unsafe_allow_html=True)
+    st.markdown('</div>', unsafe_allow_html=True)
@@ -1,56 +1,30 @@
 # Import packages for main.py 
 import streamlit as st
-import datetime
-import math
 import pandas as pd
-import openpyxl
-import requests
-from streamlit_folium import st_folium
-from geopy.distance import geodesic
 
 # Import functions from modules
 from auth import authenticate_user
-from calc_engine.uk.terrain import get_terrain_categories as get_uk_terrain
-from calc_engine.eu.terrain import get_terrain_categories as get_eu_terrain
+from calc_engine.uk import terrain as uk_terrain
+from calc_engine.eu import terrain as eu_terrain
+from calc_engine.uk.contour_plots import load_contour_data
+from calc_engine.uk.roughness import calculate_uk_roughness
+from calc_engine.uk.peak_pressure import calculate_uk_peak_pressure_no_orography, calculate_uk_peak_pressure_with_orography
+from calc_engine.eu.roughness import display_eu_roughness_calculation
+from calc_engine.eu.peak_pressure import display_eu_peak_pressure_calculation
+from calc_engine.common.basic_velocity import calculate_c_prob, calculate_c_alt
+from calc_engine.common.displacement import calculate_displacement_height, display_displacement_results
+from calc_engine.common.external_pressure import calculate_cpe, display_funnelling_inputs, display_elevation_results
 from calc_engine.common.inset_zone import detect_zone_E_and_visualise, create_styled_inset_dataframe
-from calc_engine.common.pressure_summary import create_pressure_summary, plot_elevation_with_pressures, generate_pressure_summary_paragraphs
+from calc_engine.common.pressure_summary import create_pressure_summary, plot_elevation_with_pressures, generate_pressure_summary_paragraphs, create_wind_visualisation_ui
 from visualisation.building_viz import create_building_visualisation
-from visualisation.map import render_map_with_markers, get_elevation, compute_distance, interactive_map_ui
+from visualisation.wind_zones import plot_wind_zones
 from educational import text_content
-from outputs.state_manager import add_session_save_ui, add_session_load_ui, add_pdf_export_ui
+from educational.display import load_image_bytes, render_educational_expander
+from outputs.state_manager import add_session_save_ui, add_session_load_ui
 from outputs.pdf_download import add_pdf_download_button
 
-# Set authentication from auth.py
-authenticate_user()
-
-# Setup page configuration
-st.set_page_config(page_title="Wind Load Calculator",page_icon="🌪️")
-
-# Initialize session state
-if 'initialized' not in st.session_state:
-    st.session_state.initialized = True
-    st.session_state.inputs = {}                # session state for inputs
-    st.session_state.results = {}               # session state for results
-    st.session_state.show_educational = True    # session state for educational content
-
-# Sidebar with usage instructions and educational content toggle
-st.sidebar.image("educational/images/TT_Logo_Colour.svg", width=180, output_format="PNG")
-st.sidebar.title("Options")
-
-show_educational = st.sidebar.checkbox(
-    "Show Educational Content", 
-    value=st.session_state.get("show_educational", False)
-)
-
-col1, col2, col3 = st.columns([1, 4.8, 1])
-with col2:
-    st.image("educational/images/TT_Logo_Colour.svg", width=450)
-
-st.title("Wind Load App", text_alignment="center")
-st.caption("Wind Load Calculation to BS EN 1991-1-4 and UK National Annex", text_alignment="center")
-
-TT_Grey = "rgb(99,102,105)"
-st.markdown("""
+# Print and on-screen page styles, injected once per run
+PAGE_CSS = """
 <style>
 /* ============================
    GLOBAL & PRINT-ONLY STYLES
@@ -84,19 +58,53 @@ st.markdown("""
    ON-SCREEN STYLES
    ============================ */
 
-/* Educational text in light grey */
+/* Educational text in TT grey */
 .educational-content {
     font-size: 0.8rem;
-    color: TT_Grey;
+    color: rgb(99,102,105);
 }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+# Set authentication from auth.py
+authenticate_user()
+
+# Setup page configuration
+st.set_page_config(page_title="Wind Load Calculator",page_icon="🌪️")
+
+# Initialize session state
+if 'initialized' not in st.session_state:
+    st.session_state.initialized = True
+    st.session_state.inputs = {}                # session state for inputs
+    st.session_state.results = {}               # session state for results
+    st.session_state.show_educational = True    # session state for educational content
+
+# Local handle on the inputs dict; it is only ever updated in place after this point
+inputs = st.session_state.inputs
+
+# TT logo SVG markup (st.image takes SVG as text), read from disk once via the shared image cache
+logo_svg = load_image_bytes("educational/images/TT_Logo_Colour.svg").decode("utf-8")
+
+# Sidebar with usage instructions and educational content toggle
+st.sidebar.image(logo_svg, width=180, output_format="PNG")
+st.sidebar.title("Options")
+
+show_educational = st.sidebar.checkbox(
+    "Show Educational Content", 
+    value=st.session_state.get("show_educational", False)
+)
+
+col1, col2, col3 = st.columns([1, 4.8, 1])
+with col2:
+    st.image(logo_svg, width=450)
+
+st.title("Wind Load App", text_alignment="center")
+st.caption("Wind Load Calculation to BS EN 1991-1-4 and UK National Annex", text_alignment="center")
+
+st.markdown(PAGE_CSS, unsafe_allow_html=True)
 
 if st.session_state.get("show_educational", False):
-    st.markdown('<div class="educational-expander">', unsafe_allow_html=True)
-    with st.expander("How to Use This App?", expanded=False):
-        st.markdown(f'<div class="educational-content">{text_content.how_to}</div>', unsafe_allow_html=True)
-    st.markdown('</div>', unsafe_allow_html=True)
+    render_educational_expander("How to Use This App?", text_content.how_to)
 
 # Section 1: Project Information
 st.subheader("Project Information")
@@ -104,54 +112,52 @@ col1, col2 = st.columns(2)
 
 with col1:
     # Project details
-    project_name = st.text_input("Project Name", value=st.session_state.inputs.get("project_name", ""))
-    location = st.text_input("Location (City/Country)", value=st.session_state.inputs.get("location", ""))
+    project_name = st.text_input("Project Name", value=inputs.get("project_name", ""))
+    location = st.text_input("Location (City/Country)", value=inputs.get("location", ""))
 
 with col2:
     # Project number and region
-    project_number = st.text_input("Project Number", value=st.session_state.inputs.get("project_number", ""))
+    project_number = st.text_input("Project Number", value=inputs.get("project_number", ""))
     region_options = ["United Kingdom", "Europe"]
-    region = st.selectbox("Region", options=region_options,  index=region_options.index(st.session_state.inputs.get("region", "United Kingdom")) if st.session_state.inputs.get("region") in region_options else 0)
-
-# Save project info inputs to session state
-if project_name:
-    st.session_state.inputs["project_name"] = project_name
-if project_number:
-    st.session_state.inputs["project_number"] = project_number
-if location:
-    st.session_state.inputs["location"] = location
-if region:
-    st.session_state.inputs["region"] = region
+    region = st.selectbox("Region", options=region_options,  index=region_options.index(inputs.get("region", "United Kingdom")) if inputs.get("region") in region_options else 0)
+
+# Save project info inputs to session state (blank fields keep their saved value)
+project_info = {
+    "project_name": project_name,
+    "project_number": project_number,
+    "location": location,
+    "region": region,
+}
+inputs.update({key: value for key, value in project_info.items() if value})
 
 if st.session_state.get("show_educational", False):
-    st.markdown('<div class="educational-expander">', unsafe_allow_html=True)
-    with st.expander("Which Region Should I Use?", expanded=False):
-        # st.image("educational/images/Terrain_Cats.png", caption="Terrain Types")
-        st.markdown(f'<div class="educational-content">{text_content.region_help}</div>', unsafe_allow_html=True)
-    st.markdown('</div>', unsafe_allow_html=True)
+    render_educational_expander("Which Region Should I Use?", text_content.region_help)
     
 # Divider between sections
 st.markdown("---")
 # Section 2: GEOMETRY AND TERRAIN
 st.subheader("Geometry")
-col1, col2, col3 = st.columns(3)
 
-# North-South Dimension input
-with col1:
-    NS_dimension = st.number_input("North & South Width (m)", min_value=1.0, max_value=500.0, value=float(st.session_state.inputs.get("NS_dimension", 30.0)), step=1.0)
+# Geometry inputs are batched in a form so the page only reruns once all three are set
+with st.form("geometry"):
+    col1, col2, col3 = st.columns(3)
 
-# East-West Dimension input
-with col2:
-    EW_dimension = st.number_input("East & West Width (m)", min_value=1.0, max_value=500.0, value=float(st.session_state.inputs.get("EW_dimension", 30.0)),step=1.0)
+    # North-South Dimension input
+    with col1:
+        NS_dimension = st.number_input("North & South Width (m)", min_value=1.0, max_value=500.0, value=float(inputs.get("NS_dimension", 30.0)), step=1.0)
+
+    # East-West Dimension input
+    with col2:
+        EW_dimension = st.number_input("East & West Width (m)", min_value=1.0, max_value=500.0, value=float(inputs.get("EW_dimension", 30.0)),step=1.0)
+
+    # Building Height input
+    with col3:
+        z = st.number_input("Building Height (m)", min_value=1.0, max_value=500.0, value=float(inputs.get("z", 30.0)), step=1.0)
 
-# Building Height input
-with col3:
-    z = st.number_input("Building Height (m)", min_value=1.0, max_value=500.0, value=float(st.session_state.inputs.get("z", 30.0)), step=1.0)
+    st.form_submit_button("Update geometry")
 
 # Save geometry inputs to session state
-st.session_state.inputs["NS_dimension"] = NS_dimension
-st.session_state.inputs["EW_dimension"] = EW_dimension
-st.session_state.inputs["z"] = z
+inputs.update(NS_dimension=NS_dimension, EW_dimension=EW_dimension, z=z)
 
 # 3D visualisation of the building
 building_fig = create_building_visualisation(NS_dimension, EW_dimension, z)
@@ -163,219 +169,176 @@ st.subheader("Terrain")
 # Init session defaults
 if "markers" not in st.session_state:
     st.session_state.markers = []
-if "inputs" not in st.session_state:
-    st.session_state.inputs = {"altitude": 20.0, "d_sea": 60.0}
-st.session_state.inputs.setdefault("altitude", 20.0)
-st.session_state.inputs.setdefault("d_sea", 60.0)
+inputs.setdefault("altitude", 20.0)
+inputs.setdefault("d_sea", 60.0)
 
-region = st.session_state.inputs.get("region")
+region = inputs.get("region")
 
-if region == "United Kingdom":
-    # UK: Map + distance to sea option
-    use_map = st.checkbox("Use Interactive Map", value=False, help="Uncheck to input values manually")
-    if use_map:
-        interactive_map_ui()
-    else:
+# UK: Map + distance to sea option. Non-UK: only altitude
+use_map = region == "United Kingdom" and st.checkbox("Use Interactive Map", value=False, help="Uncheck to input values manually")
+if use_map:
+    # folium/geopy are only needed for the map, so defer their import until it is switched on
+    from visualisation.map import interactive_map_ui
+    interactive_map_ui()
+else:
+    # Site inputs are batched in a form so the page only reruns once both are set
+    with st.form("site"):
         col1, col2 = st.columns(2)
         with col1:
-            altitude = st.number_input("Altitude Above Sea Level (m)", min_value=1.0, max_value=500.0, value=float(st.session_state.inputs.get("altitude", 20.0)), step=1.0)
-            st.session_state.inputs["altitude"] = altitude
-        with col2:
-            d_sea = st.number_input("Distance to Sea (km)", min_value=1.0, max_value=1000.0, value=float(st.session_state.inputs.get("d_sea", 60.0)), step=1.0)
-            st.session_state.inputs["d_sea"] = d_sea
-else:
-    # Non-UK: only altitude
-    altitude = st.number_input("Altitude Above Sea Level (m)", min_value=1.0, max_value=500.0, value=float(st.session_state.inputs.get("altitude", 20.0)), step=1.0)
-    st.session_state.inputs["altitude"] = altitude
+            altitude = st.number_input("Altitude Above Sea Level (m)", min_value=1.0, max_value=500.0, value=float(inputs.get("altitude", 20.0)), step=1.0)
+        if region == "United Kingdom":
+            with col2:
+                d_sea = st.number_input("Distance to Sea (km)", min_value=1.0, max_value=1000.0, value=float(inputs.get("d_sea", 60.0)), step=1.0)
 
-def render_terrain_category():
-    region = st.session_state.inputs.get("region")
+        st.form_submit_button("Update site")
+
+    inputs["altitude"] = altitude
     if region == "United Kingdom":
-        from calc_engine.uk import terrain as terrain_module
-    else:
-        from calc_engine.eu import terrain as terrain_module
-    
-    terrain_dict = terrain_module.get_terrain_categories()
-    display_options = [f"{code} - {desc}" for code, desc in terrain_dict.items()]
+        inputs["d_sea"] = d_sea
+
+def render_terrain_category():
+    region = inputs.get("region")
+    terrain_module = uk_terrain if region == "United Kingdom" else eu_terrain
+    terrain_codes = tuple(terrain_module.TERRAIN_CATEGORIES)
     
-    saved_terrain = st.session_state.inputs.get("terrain_category", None)
-    default_index = 0
-    if saved_terrain:
-        for i, option in enumerate(display_options):
-            if option.startswith(saved_terrain):
-                default_index = i
-                break
+    saved_terrain = inputs.get("terrain_category", None)
+    default_index = terrain_codes.index(saved_terrain) if saved_terrain in terrain_codes else 0
     
-    selected_option = st.selectbox(
+    selected_code = st.selectbox(
         "Select Terrain Category", 
-        display_options,
-        index=default_index
+        terrain_codes,
+        index=default_index,
+        format_func=terrain_module.DISPLAY_LABELS.get
     )
     
-    selected_code = selected_option.split(" - ")[0].strip()
-    st.session_state.inputs["terrain_category"] = selected_code
+    inputs["terrain_category"] = selected_code
     
     if region == "United Kingdom" and selected_code.lower() == "town":
-        d_default = float(st.session_state.inputs.get("d_town_terrain", 5.0))
+        d_default = float(inputs.get("d_town_terrain", 5.0))
         d_town_terrain = st.number_input("Distance inside Town Terrain (km)", min_value=0.1, max_value=50.0, value=d_default, step=0.1)
-        st.session_state.inputs["d_town_terrain"] = d_town_terrain
+        inputs["d_town_terrain"] = d_town_terrain
     
     if st.session_state.get("show_educational", False):
-        st.markdown('<div class="educational-expander">', unsafe_allow_html=True)
-        with st.expander("Which Terrain Type Should I Use?", expanded=False):
-            st.image("educational/images/Terrain_Cats.png", caption="Terrain Types")
-            st.markdown(f'<div class="educational-content">{text_content.terrain_help}</div>', unsafe_allow_html=True)
-        st.markdown('</div>', unsafe_allow_html=True)
+        render_educational_expander("Which Terrain Type Should I Use?", text_content.terrain_help, "educational/images/Terrain_Cats.png", caption="Terrain Types")
 
 render_terrain_category()
 
-# Section 3: WIND VELOCITY
-st.markdown("---")
-st.subheader("Basic Wind Velocity $$v_{b}$$")
-
-if region == "United Kingdom":
-    # UK calculation - uses V_b,map with altitude correction
-    V_bmap = st.number_input("$$v_{b,map}$$ (m/s)", min_value=0.1, max_value=100.0, value=float(st.session_state.inputs.get("V_bmap", 21.5)), step=0.1, help="Fundamental wind velocity from Figure 3.2")
-    st.session_state.inputs["V_bmap"] = V_bmap
-
-    if st.session_state.get("show_educational", False):
-        st.markdown('<div class="educational-expander">', unsafe_allow_html=True)
-        with st.expander("What $$v_{b,map}$$ Value Should I Use?", expanded=False):
-            col1, col2 = st.columns([0.7, 0.3])
-            with col1:
-                st.markdown(f'<div class="educational-content">{text_content.basic_wind_help}</div>', unsafe_allow_html=True)
-            with col2:
-                st.image("educational/images/Basic_Wind_Map.png", caption="Basic Wind Map", width="stretch")
-        st.markdown('</div>', unsafe_allow_html=True)
-        
+def render_probability_factor():
     # Let the user choose whether they want to override standard K, n, return period
     use_custom_values = st.checkbox("Use custom K, n, and return period?")
 
     if use_custom_values:
-        shape_column, exponent_column, period_column = st.columns(3)
-        with shape_column:
-            K = st.number_input("Shape parameter (K)", min_value=0.0, max_value=5.0, value=0.2, step=0.1, help="Typically 0.2 if unspecified.")
-        with exponent_column:
-            n = st.number_input("Exponent (n)", min_value=0.0, max_value=5.0, value=0.5, step=0.1, help="Typically 0.5 if unspecified.")
-        with period_column:
-            return_period = st.number_input("Return Period (years)", min_value=1, max_value=10000, value=50, step=1, help="Typically 50 years.")
+        # K, n and return period are batched in a form so c_prob updates once all are set
+        with st.form("probability"):
+            shape_column, exponent_column, period_column = st.columns(3)
+            with shape_column:
+                K = st.number_input("Shape parameter (K)", min_value=0.0, max_value=5.0, value=0.2, step=0.1, help="Typically 0.2 if unspecified.")
+            with exponent_column:
+                n = st.number_input("Exponent (n)", min_value=0.0, max_value=5.0, value=0.5, step=0.1, help="Typically 0.5 if unspecified.")
+            with period_column:
+                return_period = st.number_input("Return Period (years)", min_value=1, max_value=10000, value=50, step=1, help="Typically 50 years.")
+
+            st.form_submit_button("Update c_prob")
         
-        p = 1.0 / return_period
-        numerator = 1.0 - K * math.log(-math.log(1.0 - p))
-        denominator = 1.0 - K * math.log(-math.log(0.98))
-        if abs(denominator) < 1e-9:
-            st.warning("Denominator is close to zero; check K and standard reference. Setting c_prob = 1.")
-            c_prob = 1.0
-        else:
-            c_prob = (numerator / denominator) ** n
+        c_prob = calculate_c_prob(K, n, return_period)
     else:
         c_prob = 1.0
 
     st.write(f"Probability factor $c_{{prob}}$: {c_prob:.3f}")
+    return c_prob
 
-    altitude = st.session_state.inputs.get("altitude", 20.0)
+# Section 3: WIND VELOCITY
+st.markdown("---")
+st.subheader("Basic Wind Velocity $$v_{b}$$")
+
+if region == "United Kingdom":
+    # UK calculation - uses V_b,map with altitude correction
+    V_bmap = st.number_input("$$v_{b,map}$$ (m/s)", min_value=0.1, max_value=100.0, value=float(inputs.get("V_bmap", 21.5)), step=0.1, help="Fundamental wind velocity from Figure 3.2")
+    inputs["V_bmap"] = V_bmap
+
+    if st.session_state.get("show_educational", False):
+        render_educational_expander(
+            "What $$v_{b,map}$$ Value Should I Use?", text_content.basic_wind_help,
+            "educational/images/Basic_Wind_Map.png", image_columns=[0.7, 0.3],
+            caption="Basic Wind Map", width="stretch"
+        )
+        
+    c_prob = render_probability_factor()
+
+    altitude = inputs.get("altitude", 20.0)
     # Altitude correction
     if z <= 10:
         case = "z ≤ 10m"
         altitude_equation = "c_{alt} = 1 + 0.001 × A"
-        c_alt = 1 + 0.001 * altitude
     else:
         case = "z > 10m"
         altitude_equation = "c_{alt} = 1 + 0.001 × A × (10/z)^{0.2}"
-        c_alt = 1 + 0.001 * altitude * (10 / z) ** 0.2
-    st.session_state.inputs["c_alt"] = c_alt
-    
-    st.write(f"**Case: {case}**")
-    st.latex(altitude_equation)
-    st.write(f"Where A = {altitude}")
-    st.write(f"Therefore, $c_{{alt}}$ = {c_alt:.3f}")
+    c_alt = calculate_c_alt(altitude, z)
+    inputs["c_alt"] = c_alt
         
     # Calculate V_b0
     V_b0 = V_bmap * c_alt
-    st.write(f"$V_{{b0}} = V_{{b,map}} × c_{{alt}} = {V_bmap:.2f} × {c_alt:.3f} = {V_b0:.2f}$ m/s")
         
     # Directional & seasonal factors
     c_dir = 1.0
     c_season = 1.0
-    st.write(f"Directional factor $c_{{dir}}$: {c_dir}")
-    st.write(f"Seasonal factor $c_{{season}}$: {c_season}")
         
     # Basic Wind Speed with c_prob included (UK)
     V_b = V_b0 * c_dir * c_season * c_prob
     st.session_state.results["V_b"] = V_b
         
-    # Display the final result
-    st.markdown("**Basic Wind Speed**")
-    st.latex(f"V_b = c_{{dir}} × c_{{season}} × c_{{prob}} × V_{{b0}} = {V_b:.2f}\\; m/s")
+    # Display the working and final result as a single markdown element
+    st.markdown(
+        f"**Case: {case}**\n\n"
+        f"$${altitude_equation}$$\n\n"
+        f"Where A = {altitude}\n\n"
+        f"Therefore, $c_{{alt}}$ = {c_alt:.3f}\n\n"
+        f"$V_{{b0}} = V_{{b,map}} × c_{{alt}} = {V_bmap:.2f} × {c_alt:.3f} = {V_b0:.2f}$ m/s\n\n"
+        f"Directional factor $c_{{dir}}$: {c_dir}\n\n"
+        f"Seasonal factor $c_{{season}}$: {c_season}\n\n"
+        f"**Basic Wind Speed**\n\n"
+        f"$$V_b = c_{{dir}} × c_{{season}} × c_{{prob}} × V_{{b0}} = {V_b:.2f}\\; m/s$$"
+    )
 
 else:
     # EU calculation - uses V_b,0 directly without altitude correction
-    V_b0 = st.number_input("$v_{b,0}$ (m/s)", min_value=0.1, max_value=100.0, value=float(st.session_state.inputs.get("V_b0", 21.5)), step=0.1, help="Basic wind velocity for EU calculation")
-    st.session_state.inputs["V_b0"] = V_b0
+    V_b0 = st.number_input("$v_{b,0}$ (m/s)", min_value=0.1, max_value=100.0, value=float(inputs.get("V_b0", 21.5)), step=0.1, help="Basic wind velocity for EU calculation")
+    inputs["V_b0"] = V_b0
 
     if st.session_state.get("show_educational", False):
-        st.markdown('<div class="educational-expander">', unsafe_allow_html=True)
-        with st.expander("What $v_{b,0}$ Value Should I Use?", expanded=False):
-            st.markdown('<div class="educational-content">For EU calculations, use the basic wind velocity value directly from the relevant wind map or standards.</div>', unsafe_allow_html=True)
-        st.markdown('</div>', unsafe_allow_html=True)
+        render_educational_expander("What $v_{b,0}$ Value Should I Use?", "For EU calculations, use the basic wind velocity value directly from the relevant wind map or standards.")
     
-    use_custom_values = st.checkbox("Use custom K, n, and return period?")
-
-    if use_custom_values:
-        shape_column, exponent_column, period_column = st.columns(3)
-        with shape_column:
-            K = st.number_input("Shape parameter (K)", min_value=0.0, max_value=5.0, value=0.2, step=0.1, help="Typically 0.2 if unspecified.")
-        with exponent_column:
-            n = st.number_input("Exponent (n)", min_value=0.0, max_value=5.0, value=0.5, step=0.1, help="Typically 0.5 if unspecified.")
-        with period_column:
-            return_period = st.number_input("Return Period (years)", min_value=1, max_value=10000, value=50, step=1, help="Typically 50 years.")
-        
-        p = 1.0 / return_period
-        numerator = 1.0 - K * math.log(-math.log(1.0 - p))
-        denominator = 1.0 - K * math.log(-math.log(0.98))
-        if abs(denominator) < 1e-9:
-            st.warning("Denominator is close to zero; check K and standard reference. Setting c_prob = 1.")
-            c_prob = 1.0
-        else:
-            c_prob = (numerator / denominator) ** n
-    else:
-        c_prob = 1.0
-
-    st.write(f"Probability factor $c_{{prob}}$: {c_prob:.3f}")
+    c_prob = render_probability_factor()
     
     c_dir = 1.0
     c_season = 1.0
-    st.write(f"Directional factor $c_{{dir}}$: {c_dir}")
-    st.write(f"Seasonal factor $c_{{season}}$: {c_season}")
     
     V_b = c_dir * c_season * c_prob * V_b0
     st.session_state.results["V_b"] = V_b
     
-    st.markdown("**Basic Wind Speed**")
-    st.latex(f"V_b = c_{{dir}} × c_{{season}} × c_{{prob}} × V_{{b,0}} = {V_b:.2f}\\; m/s")
+    st.markdown(
+        f"Directional factor $c_{{dir}}$: {c_dir}\n\n"
+        f"Seasonal factor $c_{{season}}$: {c_season}\n\n"
+        f"**Basic Wind Speed**\n\n"
+        f"$$V_b = c_{{dir}} × c_{{season}} × c_{{prob}} × V_{{b,0}} = {V_b:.2f}\\; m/s$$"
+    )
 
 # ============================================================================
 # DISPLACEMENT HEIGHT - Always needed for both UK and EU
 # ============================================================================
-from calc_engine.common.displacement import calculate_displacement_height, display_displacement_results
 
 st.markdown("---")
 st.subheader("Displacement Height $$h_{dis}$$")
 
 # Calculate displacement height
 h_dis = calculate_displacement_height(st)
-display_displacement_results(st, h_dis)
-st.session_state.inputs["h_dis"] = h_dis
-z_minus_h_dis = z - h_dis
+z_minus_h_dis = display_displacement_results(st, h_dis)
+inputs["h_dis"] = h_dis
 st.session_state.results["z_minus_h_dis"] = z_minus_h_dis
 
 # Educational text on h_dis calculation
 if st.session_state.get("show_educational", False):
-    st.markdown('<div class="educational-expander">', unsafe_allow_html=True)
-    with st.expander("What Is $$h_{dis}$$ All About?", expanded=False):
-        st.image("educational/images/h_dis_diagram.png", width="stretch")
-        st.markdown(f'<div class="educational-content">{text_content.h_dis_help}</div>', unsafe_allow_html=True)
-    st.markdown('</div>', unsafe_allow_html=True)
+    render_educational_expander("What Is $$h_{dis}$$ All About?", text_content.h_dis_help, "educational/images/h_dis_diagram.png", width="stretch")
 
 # ============================================================================
 # PEAK WIND PRESSURE SECTION - Main calculation logic
@@ -386,18 +349,17 @@ def peak_pressure_section():
     st.subheader("Basic Wind Pressure $$q_{b}$$")
 
     # Get region
-    region = st.session_state.inputs.get("region", "United Kingdom")
+    region = inputs.get("region", "United Kingdom")
 
     # Determine region-specific default rho
     default_rho = 1.226 if region == "United Kingdom" else 1.25
 
     # If the user changed region since last run, reset rho_air to the region default
-    last_region = st.session_state.inputs.get("last_region", None)
+    last_region = inputs.get("last_region", None)
     if last_region != region:
-        st.session_state.inputs["rho_air"] = default_rho
-        st.session_state.inputs["last_region"] = region
+        inputs.update(rho_air=default_rho, last_region=region)
 
-    initial_rho = st.session_state.inputs.get("rho_air", float(default_rho))
+    initial_rho = inputs.get("rho_air", float(default_rho))
 
     # Air density input
     rho_air = st.number_input(
@@ -408,7 +370,7 @@ def peak_pressure_section():
         step=0.001,
         format="%.3f"
     )
-    st.session_state.inputs["rho_air"] = float(rho_air)
+    inputs["rho_air"] = float(rho_air)
     
     # Basic wind pressure calculation
     v_b = st.session_state.results.get("V_b", 0.0)
@@ -425,36 +387,24 @@ def peak_pressure_section():
         
         # Educational text on Orography Significance
         if st.session_state.get("show_educational", False):
-            st.markdown('<div class="educational-expander">', unsafe_allow_html=True)
-            with st.expander("Is Orography Significant?", expanded=False):
-                st.image("educational/images/Orography_Diagram.png", width="stretch")
-                st.markdown(f'<div class="educational-content">{text_content.orography_help}</div>', unsafe_allow_html=True)
-            st.markdown('</div>', unsafe_allow_html=True)
+            render_educational_expander("Is Orography Significant?", text_content.orography_help, "educational/images/Orography_Diagram.png", width="stretch")
         
         # CRITICAL DECISION POINT: Is orography significant?
         is_orography_significant = st.checkbox(
             "Orography is significant", 
-            value=st.session_state.inputs.get("is_orography_significant", False),
+            value=inputs.get("is_orography_significant", False),
             help="Check if the site has significant terrain features (hills, cliffs, ridges) per Figure NA.2"
         )
-        st.session_state.inputs["is_orography_significant"] = is_orography_significant
+        inputs["is_orography_significant"] = is_orography_significant
         
-        # Get common parameters
-        from calc_engine.uk.contour_plots import load_contour_data
-        from calc_engine.uk.peak_pressure import (
-            calculate_uk_peak_pressure_no_orography,
-            calculate_uk_peak_pressure_with_orography
-        )
-        
-        # Load the contour data
-        contour_data_path = "calc_engine/uk/contour_data.xlsx"
-        datasets = load_contour_data(contour_data_path)
+        # Load the contour data (cached across reruns)
+        datasets = load_contour_data()
         
         # Get parameters from session state
-        d_sea = st.session_state.inputs.get("d_sea", 60.0)
+        d_sea = inputs.get("d_sea", 60.0)
         z_minus_h_dis = st.session_state.results.get("z_minus_h_dis", 10.0)
-        terrain = st.session_state.inputs.get("terrain_category", "").lower()
-        z = st.session_state.inputs.get("z", 30.0)
+        terrain = inputs.get("terrain_category", "").lower()
+        z = inputs.get("z", 30.0)
         
         # ====================================================================
         # PATH 1: OROGRAPHY IS SIGNIFICANT
@@ -465,12 +415,12 @@ def peak_pressure_section():
                 "Orography factor $c_o(z)$",
                 min_value=0.0,
                 max_value=5.0,
-                value=st.session_state.inputs.get("c_o", 1.0),
+                value=inputs.get("c_o", 1.0),
                 step=0.1,
                 format="%.2f",
                 help="Enter the orography factor for the site (from Annex A of EN 1991-1-4)"
             )
-            st.session_state.inputs["c_o"] = c_o
+            inputs["c_o"] = c_o
             
             # Check if we need mean wind velocity (only for z > 50m)
             if z > 50:
@@ -480,13 +430,11 @@ def peak_pressure_section():
                 # Calculate roughness factor for UK
                 st.markdown("#### Roughness Factor $C_r(z)$")
                 
-                from calc_engine.uk.roughness import calculate_uk_roughness
-                
                 # Calculate UK roughness factor
                 c_rz = calculate_uk_roughness(st, datasets)
                 
                 # Get terrain type for UK calculation
-                terrain_type = st.session_state.inputs.get("terrain_type", "")
+                terrain_type = inputs.get("terrain_type", "")
                 
                 # Initialize terrain factor
                 c_rT = 1.0
@@ -522,7 +470,7 @@ def peak_pressure_section():
         else:
            
             # Set c_o to 1.0 for consistency (not used in calculation)
-            st.session_state.inputs["c_o"] = 1.0
+            inputs["c_o"] = 1.0
             
             # No mean wind velocity needed - go straight to peak pressure
             st.session_state.results["v_mean"] = 0.0
@@ -543,16 +491,14 @@ def peak_pressure_section():
         st.markdown("---")
         st.subheader("Mean Wind Velocity $$v_{m}$$")
         
-        from calc_engine.eu.roughness import display_eu_roughness_calculation
-        
         z_minus_h_dis = st.session_state.results.get("z_minus_h_dis", 10.0)
-        terrain_category = st.session_state.inputs.get("terrain_category", "II")
+        terrain_category = inputs.get("terrain_category", "II")
         
         # Calculate and display EU roughness factor
         c_rz = display_eu_roughness_calculation(st, z_minus_h_dis, terrain_category)
         
         # Get orography factor
-        c_o = st.session_state.inputs.get("c_o", 1.0)
+        c_o = inputs.get("c_o", 1.0)
         
         # Calculate mean wind velocity
         v_mean = v_b * c_rz * c_o
@@ -564,18 +510,12 @@ def peak_pressure_section():
         
         # Educational text on Orography Significance (EU version)
         if st.session_state.get("show_educational", False):
-            st.markdown('<div class="educational-expander">', unsafe_allow_html=True)
-            with st.expander("Is Orography Significant?", expanded=False):
-                st.image("educational/images/Orography_Diagram.png", width="stretch")
-                st.markdown(f'<div class="educational-content">{text_content.orography_help}</div>', unsafe_allow_html=True)
-            st.markdown('</div>', unsafe_allow_html=True)
+            render_educational_expander("Is Orography Significant?", text_content.orography_help, "educational/images/Orography_Diagram.png", width="stretch")
         
         # Calculate EU peak pressure
         st.markdown("---")
         st.subheader("Peak Velocity Pressure $$q_p(z)$$")
         
-        from calc_engine.eu.peak_pressure import display_eu_peak_pressure_calculation
-        
         q_p = display_eu_peak_pressure_calculation(
             st, z_minus_h_dis, terrain_category, v_b, rho_air, c_o
         )
@@ -592,65 +532,72 @@ st.write("#### Inset Storey")
 
 add_inset = st.checkbox(
     "Add inset zone (upper storey)",
-    value=bool(st.session_state.inputs.get("inset_enabled", False)),
+    value=bool(inputs.get("inset_enabled", False)),
     help="Enable to consider additional wind suction effects from inset zones as per PD 6688-1-4"
 )
-st.session_state.inputs["inset_enabled"] = bool(add_inset)
+inputs["inset_enabled"] = bool(add_inset)
 
 if st.session_state.get("show_educational", False):
-    st.markdown('<div class="educational-expander">', unsafe_allow_html=True)
-    with st.expander("What Are Inset Zones?", expanded=False):
-        st.markdown(f'<div class="educational-content">{text_content.inset_zone_help}</div>', unsafe_allow_html=True)
-    st.markdown('</div>', unsafe_allow_html=True)
-    
+    render_educational_expander("What Are Inset Zones?", text_content.inset_zone_help)
+
 if add_inset:
     c1, c2, c3, c4 = st.columns([1, 1, 1, 1])
     with c1:
-        north_offset = st.number_input("North offset (m)", min_value=0.0, max_value=1000.0, value=float(st.session_state.inputs.get("north_offset", 0.0)), step=0.1)
-        st.session_state.inputs["north_offset"] = float(north_offset)
+        north_offset = st.number_input("North offset (m)", min_value=0.0, max_value=1000.0, value=float(inputs.get("north_offset", 0.0)), step=0.1)
     with c2:
-        south_offset = st.number_input("South offset (m)", min_value=0.0, max_value=1000.0, value=float(st.session_state.inputs.get("south_offset", 4.0)), step=0.1)
-        st.session_state.inputs["south_offset"] = float(south_offset)
+        south_offset = st.number_input("South offset (m)", min_value=0.0, max_value=1000.0, value=float(inputs.get("south_offset", 4.0)), step=0.1)
     with c3:
-        east_offset = st.number_input("East offset (m)", min_value=0.0, max_value=1000.0, value=float(st.session_state.inputs.get("east_offset", 0.0)), step=0.1)
-        st.session_state.inputs["east_offset"] = float(east_offset)
+        east_offset = st.number_input("East offset (m)", min_value=0.0, max_value=1000.0, value=float(inputs.get("east_offset", 0.0)), step=0.1)
     with c4:
-        west_offset = st.number_input("West offset (m)", min_value=0.0, max_value=1000.0, value=float(st.session_state.inputs.get("west_offset", 4.0)), step=0.1)
-        st.session_state.inputs["west_offset"] = float(west_offset)
-    
+        west_offset = st.number_input("West offset (m)", min_value=0.0, max_value=1000.0, value=float(inputs.get("west_offset", 4.0)), step=0.1)
+
     inset_col1, inset_col2 = st.columns([1, 2])
     with inset_col1:
-        inset_height = st.number_input("Inset height H1 (m)", min_value=0.0, max_value=500.0, value=float(st.session_state.inputs.get("inset_height", 10.0)), step=0.1)
-        st.session_state.inputs["inset_height"] = float(inset_height)
+        inset_height = st.number_input("Inset height H1 (m)", min_value=0.0, max_value=500.0, value=float(inputs.get("inset_height", 10.0)), step=0.1)
+
+    inputs.update(
+        north_offset=float(north_offset),
+        south_offset=float(south_offset),
+        east_offset=float(east_offset),
+        west_offset=float(west_offset),
+        inset_height=float(inset_height),
+    )
 
     # Call the visualiser with the stored values
-    call_inset_height = float(st.session_state.inputs.get("inset_height", 4.0))
-    call_north_offset = float(st.session_state.inputs.get("north_offset", 5.0))
-    call_south_offset = float(st.session_state.inputs.get("south_offset", 0.0))
-    call_east_offset  = float(st.session_state.inputs.get("east_offset", 5.0))
-    call_west_offset  = float(st.session_state.inputs.get("west_offset", 0.0))
-
-    results, fig = detect_zone_E_and_visualise(
-        st.session_state,
-        inset_height=call_inset_height,
-        north_offset=call_north_offset,
-        south_offset=call_south_offset,
-        east_offset=call_east_offset,
-        west_offset=call_west_offset,
-    )
+    call_inset_height = float(inputs.get("inset_height", 4.0))
+    call_north_offset = float(inputs.get("north_offset", 5.0))
+    call_south_offset = float(inputs.get("south_offset", 0.0))
+    call_east_offset  = float(inputs.get("east_offset", 5.0))
+    call_west_offset  = float(inputs.get("west_offset", 0.0))
+
+    if max(call_north_offset, call_south_offset, call_east_offset, call_west_offset) == 0.0:
+        # Every Zone E edge check needs a non-zero offset on that side, so there is nothing to detect or draw
+        st.info("Enter a non-zero offset to generate the inset zone.")
+        st.session_state["inset_results"] = None
+        st.session_state["inset_fig"] = None
+        st.session_state.results["inset_results"] = None
+    else:
+        results, fig = detect_zone_E_and_visualise(
+            st.session_state,
+            inset_height=call_inset_height,
+            north_offset=call_north_offset,
+            south_offset=call_south_offset,
+            east_offset=call_east_offset,
+            west_offset=call_west_offset,
+        )
 
-    # store + display
-    st.session_state["inset_results"] = results
-    st.session_state["inset_fig"] = fig
+        # store + display
+        st.session_state["inset_results"] = results
+        st.session_state["inset_fig"] = fig
 
-    # Store inset results in inputs for export
-    st.session_state.results["inset_results"] = results
+        # Store inset results in inputs for export
+        st.session_state.results["inset_results"] = results
 
-    st.plotly_chart(fig, width="stretch")
-        
-    # Display styled dataframe
-    styled_df = create_styled_inset_dataframe(results)
-    st.dataframe(styled_df)
+        st.plotly_chart(fig, width="stretch")
+
+        # Display styled table as static HTML; it is a read-only summary, so the interactive grid isn't needed
+        styled_df = create_styled_inset_dataframe(results)
+        st.markdown(styled_df.to_html(), unsafe_allow_html=True)
 
 else:
     # Inset disabled: do NOT show inputs or visualisation.
@@ -660,43 +607,29 @@ else:
 
 st.markdown("---")
 st.write("#### Funnelling")
-# Import required modules
-from visualisation.wind_zones import plot_wind_zones
-from calc_engine.common.external_pressure import calculate_cpe, display_funnelling_inputs, display_elevation_results
 
 # Add checkbox to control funnelling consideration
 consider_funnelling = st.checkbox(
     "Consider Funnelling Effects",
-    value=bool(st.session_state.inputs.get("consider_funnelling", False)),
+    value=bool(inputs.get("consider_funnelling", False)),
     help="Enable to consider funnelling effects between buildings as per BS EN 1991-1-4"
 )
 
 # persist the checkbox state
-st.session_state.inputs["consider_funnelling"] = bool(consider_funnelling)
+inputs["consider_funnelling"] = bool(consider_funnelling)
 # Educational text on funnelling calculation
 if st.session_state.get("show_educational", False):
-    st.markdown('<div class="educational-expander">', unsafe_allow_html=True)
-
-    with st.expander("What Is Funnelling?", expanded=False):
-        # st.image("educational/images/h_dis_diagram.png", width="stretch")
-        st.markdown(f'<div class="educational-content">{text_content.funnelling_help}</div>', unsafe_allow_html=True)
-
-    st.markdown('</div>', unsafe_allow_html=True)
+    render_educational_expander("What Is Funnelling?", text_content.funnelling_help)
 # Display funnelling inputs regardless of whether funnelling is enabled
 if consider_funnelling == True:
+    # Gap values are stored in session state by display_funnelling_inputs
     north_gap, south_gap, east_gap, west_gap = display_funnelling_inputs()
 
-    # Store gap values in session state
-    st.session_state.inputs["north_gap"] = float(north_gap)
-    st.session_state.inputs["south_gap"] = float(south_gap)
-    st.session_state.inputs["east_gap"] = float(east_gap)
-    st.session_state.inputs["west_gap"] = float(west_gap)
-
 st.markdown("---")
 st.write('### External Pressure Coefficients $$c_{p,e}$$')
 
 # Loaded area input. This will only appear when region is EU
-region = st.session_state.inputs.get("region", "United Kingdom")
+region = inputs.get("region", "United Kingdom")
 if region != "United Kingdom":  # Show for EU region
     loaded_area = st.number_input(
         "Loaded Area (m²)", 
@@ -707,45 +640,40 @@ if region != "United Kingdom":  # Show for EU region
         help="Area over which the wind load is applied. Used for interpolating between Cpe,1 and Cpe,10 values.", 
         key="loaded_area_input"
     )
-    st.session_state.inputs["loaded_area"] = loaded_area
+    inputs["loaded_area"] = loaded_area
 
 # Automatically calculate cp,e values with or without funnelling based on checkbox
 cp_results_by_elevation = calculate_cpe(consider_funnelling=consider_funnelling)
-    
-# Get building dimensions from session state
-h = st.session_state.inputs.get("z", 10.0)  # Building height
-NS_dimension = st.session_state.inputs.get("NS_dimension", 20.0)
-EW_dimension = st.session_state.inputs.get("EW_dimension", 40.0)
+
+# Gap per elevation, shown alongside each table when funnelling is considered
+gaps = None
+if consider_funnelling:
+    gaps = {"North": north_gap, "East": east_gap, "South": south_gap, "West": west_gap}
 
 # Display results for each elevation using our new function
+# (geometry comes from the form values already stored in inputs)
 elevations = ["North", "East", "South", "West"]
 for elevation in elevations:
     display_elevation_results(
         elevation=elevation, 
         cp_results=cp_results_by_elevation, 
-        h=h, 
+        h=z, 
         NS_dimension=NS_dimension, 
-        EW_dimension=EW_dimension
+        EW_dimension=EW_dimension,
+        gaps=gaps
     )
 
-# Store overall results for later use (combine all directions)
-all_results = []
-for direction, df in cp_results_by_elevation.items():
-    df_with_direction = df.copy()
-    df_with_direction["Wind Direction"] = direction
-    all_results.append(df_with_direction)
-
 # STORE CP RESULTS - Combined DataFrame with all directions
-cp_results_combined = pd.concat(all_results, ignore_index=True)
+# (concatenate once, then label the rows, rather than copying each direction's frame)
+cp_results_combined = pd.concat(cp_results_by_elevation.values(), ignore_index=True)
+cp_results_combined["Wind Direction"] = [
+    direction for direction, df in cp_results_by_elevation.items() for _ in range(len(df))
+]
 st.session_state.results['cp_results'] = cp_results_combined
 
 # Educational text on wind zone plots
 if st.session_state.get("show_educational", False):
-    st.markdown('<div class="educational-expander">', unsafe_allow_html=True)
-    with st.expander("How Are Wind Zones Plotted?", expanded=False):
-        st.image("educational/images/wind_zones_diagram.png", width="stretch")
-        st.markdown(f'<div class="educational-content">{text_content.wind_zone_help}</div>', unsafe_allow_html=True)
-    st.markdown('</div>', unsafe_allow_html=True)
+    render_educational_expander("How Are Wind Zones Plotted?", text_content.wind_zone_help, "educational/images/wind_zones_diagram.png", width="stretch")
 
 # Display wind zone plots (using your existing function)
 ns_elevation_fig, ew_elevation_fig = plot_wind_zones(st.session_state)
@@ -756,53 +684,64 @@ st.plotly_chart(ns_elevation_fig, width="stretch")
 # Display East-West Elevation
 st.plotly_chart(ew_elevation_fig, width="stretch")
 
-# Results Summary section
-st.markdown("---")
-st.markdown('<div class="pagebreak"></div>', unsafe_allow_html=True)
-st.subheader("Net Pressures")
-
-# Educational text on Wind Pressure Profile
-if st.session_state.get("show_educational", False):
-    st.markdown('<div class="educational-expander">', unsafe_allow_html=True)
-    with st.expander("How Is Net Pressure Calculated?", expanded=False):
-        st.image("educational/images/We_Wi.png", width="stretch")
-        st.markdown(f'<div class="educational-content">{text_content.net_pressure_help}</div>', unsafe_allow_html=True)
-    st.markdown('</div>', unsafe_allow_html=True)
-
-from calc_engine.common.pressure_summary import create_pressure_summary, plot_elevation_with_pressures
-
-# Calculate pressure summary
-results_by_direction = calculate_cpe()  # Make sure this function exists
-summary_df = create_pressure_summary(st.session_state, results_by_direction)
+# Net pressures, the elevation diagrams and the summary all scale with q_p, so only
+# produce them (and the results the PDF report reads) when it is positive
+if st.session_state.results.get("q_p", 0.0) > 0.0:
+    # Results Summary section
+    st.markdown("---")
+    st.markdown('<div class="pagebreak"></div>', unsafe_allow_html=True)
+    st.subheader("Net Pressures")
 
-# STORE PRESSURE SUMMARY
-st.session_state.results['summary_df'] = summary_df
+    # Educational text on Wind Pressure Profile
+    if st.session_state.get("show_educational", False):
+        render_educational_expander("How Is Net Pressure Calculated?", text_content.net_pressure_help, "educational/images/We_Wi.png", width="stretch")
 
-# Create elevation figures with pressures
-elevation_figures = plot_elevation_with_pressures(st.session_state, results_by_direction)
+    # Calculate pressure summary from the cp,e values computed for the wind zones above
+    results_by_direction = cp_results_by_elevation
+    summary_df = create_pressure_summary(st.session_state, results_by_direction)
 
-# Display results
-st.subheader("Pressure Summary")
-st.dataframe(summary_df, hide_index=True, height=35*len(summary_df)+38)
+    # STORE PRESSURE SUMMARY
+    st.session_state.results['summary_df'] = summary_df
 
-# Display figures
-for direction, fig in elevation_figures.items():
-    st.plotly_chart(fig, width="stretch")
+    # Display results
+    st.subheader("Pressure Summary")
+    st.dataframe(summary_df, hide_index=True, height=35*len(summary_df)+38)
 
-# 3D visualisation (if educational mode enabled)
-if st.session_state.get("show_educational", False):
-    st.subheader("3D Wind Visualisation") 
-    from calc_engine.common.pressure_summary import create_wind_visualisation_ui
-    create_wind_visualisation_ui(st.session_state, results_by_direction)
+    # Elevation figures with pressures are only built and drawn while the expander is open
+    elevation_expander = st.expander(
+        "Elevation pressure diagrams",
+        expanded=False,
+        key="elevation_pressure_diagrams",
+        on_change="rerun"
+    )
+    with elevation_expander:
+        if elevation_expander.open:
+            elevation_figures = plot_elevation_with_pressures(st.session_state, results_by_direction)
+            # One tab per elevation; only the selected tab's figure is sent to the browser
+            elevation_tabs = st.tabs(list(elevation_figures), key="elevation_pressure_tabs", on_change="rerun")
+            for tab, fig in zip(elevation_tabs, elevation_figures.values()):
+                with tab:
+                    if tab.open:
+                        st.plotly_chart(fig, width="stretch")
+
+    # 3D visualisation (if educational mode enabled)
+    if st.session_state.get("show_educational", False):
+        st.subheader("3D Wind Visualisation") 
+        create_wind_visualisation_ui(st.session_state, results_by_direction)
 
-# Results Summary section
-st.markdown("---")
-st.subheader("Summary")
+    # Results Summary section
+    st.markdown("---")
+    st.subheader("Summary")
 
-summary_paragraphs = generate_pressure_summary_paragraphs(st.session_state, results_by_direction)
-for p in summary_paragraphs:
-    st.markdown(p)
-st.session_state.results['summary_paragraphs'] = summary_paragraphs
+    summary_paragraphs = generate_pressure_summary_paragraphs(st.session_state, results_by_direction)
+    # Blank-line separated so each paragraph (and "---" rule) keeps its own block in one markdown element
+    st.markdown("\n\n".join(summary_paragraphs))
+    st.session_state.results['summary_paragraphs'] = summary_paragraphs
+else:
+    st.markdown("---")
+    st.warning("Peak velocity pressure is unavailable, so net pressures cannot be calculated. Check the wind velocity and orography inputs above.")
+    for key in ("summary_df", "summary_paragraphs"):
+        st.session_state.results.pop(key, None)
 
 # ============================================================================
 # SIDEBAR - Report Export
@@ -816,7 +755,7 @@ st.sidebar.header("📊 Report Export")
 # Optional project name input for PDF header
 project_name_input = st.sidebar.text_input(
     "Project Name (optional)",
-    value=st.session_state.inputs.get("project_name", "") if hasattr(st.session_state, 'inputs') else "",
+    value=inputs.get("project_name", ""),
     help="Customize the PDF report header",
     placeholder="e.g., My Wind Load Project",
     key="pdf_project_name_override"
@@ -825,7 +764,9 @@ project_name_input = st.sidebar.text_input(
 # Generate PDF report
 st.sidebar.subheader("📄 PDF Report")
 add_pdf_download_button(
-    project_name=project_name_input if project_name_input else None
+    project_name=project_name_input if project_name_input else None,
+    # The report is built around the net pressures, which need a positive q_p
+    disabled=st.session_state.results.get("q_p", 0.0) <= 0.0
 )
 
 st.sidebar.markdown("---")
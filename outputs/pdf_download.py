@@ -16,6 +16,7 @@ from reportlab.lib.enums import TA_LEFT, TA_CENTER, TA_RIGHT
 from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfbase.ttfonts import TTFont
 import os
+from xml.sax.saxutils import escape
 
 # Import the StateManager
 from outputs.state_manager import StateManager
@@ -41,7 +42,6 @@ class WindLoadReport:
         # Use project name from parameter or from inputs
         self.project_name = project_name or self.inputs.get("project_name", "Wind Load Project")
         
-        self.buffer = io.BytesIO()
         self.page_width = A4[0]
         self.page_height = A4[1]
         self.left_margin = 30
@@ -152,9 +152,8 @@ class WindLoadReport:
         for logo_path in logo_paths:
             if os.path.exists(logo_path):
                 try:
-                    from reportlab.platypus import Image as RLImage
                     logo_height = 3  # mm
-                    logo = RLImage(logo_path, height=logo_height*mm)
+                    logo = Image(logo_path, height=logo_height*mm)
                     logo.drawHeight = logo_height * mm
                     logo.drawWidth = logo.imageWidth * (logo_height * mm / logo.imageHeight)
                     logo.drawOn(canvas, self.left_margin, 20)
@@ -656,9 +655,10 @@ class WindLoadReport:
         story.append(Spacer(1, 12))
     
     def generate(self):
-        """Generate the complete PDF report."""
+        """Generate the complete PDF report into a new buffer, so it can be called repeatedly."""
+        buffer = io.BytesIO()
         doc = SimpleDocTemplate(
-            self.buffer,
+            buffer,
             pagesize=A4,
             rightMargin=self.right_margin,
             leftMargin=self.left_margin,
@@ -710,8 +710,8 @@ class WindLoadReport:
         # Build PDF
         doc.build(story, onFirstPage=self._header_footer, onLaterPages=self._header_footer)
         
-        self.buffer.seek(0)
-        return self.buffer
+        buffer.seek(0)
+        return buffer
 
 
 def create_pdf_report(project_name: Optional[str] = None) -> io.BytesIO:
@@ -732,10 +732,52 @@ def create_pdf_report(project_name: Optional[str] = None) -> io.BytesIO:
     return report.generate()
 
 
+def _show_pdf_error(e):
+    """Show a PDF generation failure in the sidebar, with the traceback in an expander."""
+    st.sidebar.error(f"❌ PDF generation failed: {str(e)}")
+    # Show detailed error in expander for debugging
+    with st.sidebar.expander("🔍 Error details"):
+        st.exception(e)
+
+
+def _error_pdf(e) -> io.BytesIO:
+    """Build a one-page PDF stating that the report could not be generated, and why."""
+    buffer = io.BytesIO()
+    styles = getSampleStyleSheet()
+    doc = SimpleDocTemplate(buffer, pagesize=A4)
+    doc.build([
+        Paragraph("PDF generation failed", styles['Title']),
+        Paragraph(escape(f"{type(e).__name__}: {e}"), styles['BodyText']),
+        Spacer(1, 12),
+        Paragraph("Check the inputs in the app and download the report again.", styles['BodyText'])
+    ])
+    buffer.seek(0)
+    return buffer
+
+
+def _deferred_pdf(report, errors):
+    """
+    Wrap report.generate for use as deferred download_button data.
+    
+    Streamlit runs the callable on its own thread when the button is clicked,
+    where st.* calls are ignored. A failure therefore downloads a PDF stating
+    the error rather than the report, and is recorded in `errors` so that
+    add_pdf_download_button also shows it in the sidebar on the next run.
+    """
+    def generate():
+        try:
+            return report.generate()
+        except Exception as e:
+            errors.append(e)
+            return _error_pdf(e)
+    return generate
+
+
 def add_pdf_download_button(
     filename: Optional[str] = None,
     button_label: str = "📄 Download PDF",
-    project_name: Optional[str] = None
+    project_name: Optional[str] = None,
+    disabled: bool = False
 ):
     """
     Add a download button to the Streamlit sidebar for the PDF report.
@@ -749,6 +791,8 @@ def add_pdf_download_button(
         The label for the download button
     project_name : Optional[str]
         Project name to include in header
+    disabled : bool
+        Show the button greyed out, e.g. while the results are incomplete
     """
     # Check if required data exists
     if not hasattr(st.session_state, 'inputs') or not st.session_state.inputs:
@@ -762,19 +806,24 @@ def add_pdf_download_button(
         timestamp = datetime.now().strftime("%Y%m%d_%H%M")
         filename = f"{safe_name}_Report_{timestamp}.pdf"
     
+    # Failures from a previous click's deferred generation
+    pdf_errors = st.session_state.setdefault("pdf_generation_errors", [])
+    while pdf_errors:
+        _show_pdf_error(pdf_errors.pop(0))
+    
     try:
-        pdf_buffer = create_pdf_report(project_name)
+        # Snapshot the session data now, but only build the PDF when the button
+        # is clicked (Streamlit runs a callable data argument on demand)
+        report = WindLoadReport(project_name)
         
         st.sidebar.download_button(
             label=button_label,
-            data=pdf_buffer,
+            data=_deferred_pdf(report, pdf_errors),
             file_name=filename,
             mime="application/pdf",
             help="Download wind load calculation report as PDF",
-            width="stretch"
+            width="stretch",
+            disabled=disabled
         )
     except Exception as e:
-        st.sidebar.error(f"❌ PDF generation failed: {str(e)}")
-        # Show detailed error in expander for debugging
-        with st.sidebar.expander("🔍 Error details"):
-            st.exception(e)
+        _show_pdf_error(e)
@@ -8,6 +8,7 @@ import streamlit as st
 import pandas as pd
 import os
 from datetime import datetime
+from functools import partial
 from typing import Any, Dict, List, Optional, Union
 
 
@@ -113,8 +114,18 @@ class StateManager:
             date_str = datetime.now().strftime('%y%m%d')
             filename = f"{date_str}_{project_name}_Wind Load Session.json"
         
+        return self.build_session_json(self.get_session_inputs(), filename)
+    
+    def build_session_json(self, inputs: Dict[str, Any], filename: str) -> str:
+        """
+        Build the session save JSON from already-serialized inputs.
+        Does not touch session state, so it is safe to run off the script thread.
+        
+        Returns:
+            str: JSON string ready for download
+        """
         data = {
-            "inputs": self.get_session_inputs(),
+            "inputs": inputs,
             "_metadata": {
                 "filename": filename,
                 "saved_at": datetime.now().isoformat(),
@@ -373,13 +384,14 @@ def add_session_save_ui():
     date_str = datetime.now().strftime('%y%m%d')
     filename = f"{date_str}_{project_name}_Wind Load Session.json"
     
-    # Generate JSON
-    json_content = manager.save_session(filename)
+    # Snapshot the inputs now; the JSON itself is only built when the button is
+    # clicked, on Streamlit's download thread rather than on every rerun
+    session_inputs = manager.get_session_inputs()
     
     # Download button
     st.sidebar.download_button(
         label="📥 Download Session",
-        data=json_content,
+        data=partial(manager.build_session_json, session_inputs, filename),
         file_name=filename,
         mime="application/json",
         help="Download session file (inputs only)",
@@ -1,4 +1,7 @@
 import plotly.graph_objects as go
+import streamlit as st
+
+@st.cache_data(show_spinner=False, max_entries=32)
 def create_building_visualisation(NS_dimension, EW_dimension, z, include_inset=False, inset_offset=0, inset_height=0):
     # Define colors
     TT_LightBlue = "rgb(136,219,223)"
@@ -4,6 +4,7 @@ import streamlit as st
 from streamlit_folium import st_folium
 from geopy.distance import geodesic
 from educational import text_content
+from educational.display import render_educational_expander
 
 
 def render_map_with_markers(
@@ -96,9 +97,11 @@ def render_map_with_markers(
     return st_folium(m, width=width, height=height, key="map")
 
 
+@st.cache_data(show_spinner=False, max_entries=128)
 def get_elevation(lat: float, lon: float) -> float:
     """
     Fetches elevation (in meters) for given coordinates using Open-Elevation API.
+    Cached per coordinate pair, so recalculating for the same marker skips the request.
     """
     url = "https://api.open-elevation.com/api/v1/lookup"
     params = {"locations": f"{lat},{lon}"}
@@ -116,10 +119,7 @@ def compute_distance(coord1: tuple[float, float], coord2: tuple[float, float]) -
 def interactive_map_ui():
     # === MAP MODE ===
     if st.session_state.get("show_educational", False):
-        st.markdown('<div class="educational-expander">', unsafe_allow_html=True)
-        with st.expander("How Do I Use The Map?", expanded=False):
-            st.markdown(f'<div class="educational-content">{text_content.map_help}</div>', unsafe_allow_html=True)
-        st.markdown('</div>', unsafe_allow_html=True)
+        render_educational_expander("How Do I Use The Map?", text_content.map_help)
 
     map_col, info_col = st.columns([3, 1])
 
@@ -168,13 +168,10 @@ def interactive_map_ui():
     if calculate_btn and st.session_state.markers:
         with st.spinner("Calculating geospatial data..."):
             try:
-                elevations = []
-                for lat, lon in st.session_state.markers:
-                    altitude_factor = get_elevation(lat, lon)
-                    elevations.append(altitude_factor)
-
-                if len(elevations) >= 1:
-                    st.session_state.inputs["altitude_factor"] = float(elevations[0])
+                # Only the project location's elevation is used; the sea marker
+                # only sets the distance, which is computed locally
+                lat, lon = st.session_state.markers[0]
+                st.session_state.inputs["altitude_factor"] = float(get_elevation(lat, lon))
 
                 if len(st.session_state.markers) == 2:
                     d_sea = compute_distance(st.session_state.markers[0], st.session_state.markers[1])
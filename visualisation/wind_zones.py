@@ -1,5 +1,6 @@
 # visualisation/wind_zones.py
 import plotly.graph_objects as go
+import streamlit as st
 
 def plot_wind_zones(session_state):
     """
@@ -46,15 +47,13 @@ def plot_wind_zones(session_state):
     
     return NS_elevation_fig, EW_elevation_fig
 
-import plotly.graph_objects as go
-
-import plotly.graph_objects as go
-
+@st.cache_data(show_spinner=False, max_entries=32)
 def create_elevation_plot(width, height, crosswind_dim, zone_colors, title):
     """
     Create a single elevation plot with wind zones.
     Width labels now have small white arrows pointing to zone boundaries,
     with adjustable offset and standoff so text and arrows don't overlap.
+    Cached on its scalar inputs so reruns with unchanged geometry reuse the figure.
     """
     # Adjustable settings for dimension arrows
     arrow_offset_factor = 0.15  # proportion of zone width from text to arrow start
@@ -225,8 +224,6 @@ def integrate_with_streamlit(session_state):
     session_state : StreamlitSessionState
         Streamlit session state containing building dimensions
     """
-    import streamlit as st
-    
     # Get the elevation plots
     ns_fig, ew_fig = plot_wind_zones(session_state)
     